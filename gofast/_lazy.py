@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#   Licence: BSD 3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+"""
+Module attributes resolved on first access (PEP 562). A module hands its
+loaders to :func:`attach` and binds the returned ``__getattr__`` and
+``__dir__`` at module level; each value is then cached in the module
+namespace so later lookups no longer go through ``__getattr__``.
+"""
+import importlib
+
+__all__=['attach', 'from_submodules']
+
+def attach(name, namespace, loaders):
+    """ Build the ``__getattr__`` and ``__dir__`` of module `name`.
+
+    Parameters
+    -----------
+    name: str
+        Name of the module, i.e. its ``__name__``.
+    namespace: dict
+        The module namespace, i.e. its ``globals()``, where the loaded
+        values are cached.
+    loaders: dict
+        Zero-argument callable returning the value of each lazy attribute.
+
+    Returns
+    --------
+    __getattr__, __dir__: callable
+        The module-level hooks to bind in the module.
+    """
+    def __getattr__(attr):
+        try:
+            load = loaders[attr]
+        except KeyError:
+            raise AttributeError(
+                f"module {name!r} has no attribute {attr!r}") from None
+        value = namespace[attr] = load()
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(loaders))
+
+    return __getattr__, __dir__
+
+def from_submodules(package, lazy):
+    """ Build the loaders of names defined in the submodules of `package`.
+
+    Parameters
+    -----------
+    package: str
+        Name of the package the submodules are relative to.
+    lazy: dict
+        The ``(submodule, attribute)`` pair of each name, e.g.
+        ``{'mean': ('.utils', 'mean')}``. An attribute of ``None``
+        stands for the submodule itself.
+
+    Returns
+    --------
+    loaders: dict
+        The loaders to pass to :func:`attach`.
+    """
+    def loader(module, attr):
+        def load():
+            value = importlib.import_module(module, package)
+            return value if attr is None else getattr(value, attr)
+        return load
+
+    return {name: loader(module, attr)
+            for name, (module, attr) in lazy.items()}
@@ -4,24 +4,37 @@
 """
 Created on Thu Dec 21 14:43:09 2023
 @author: a.k.a Daniel
+
+Each generator draws whole columns at once and builds its frame in a 
+single call. To get a larger dataset, pass a larger `samples` rather than 
+calling a generator in a loop and appending or concatenating the results: 
+growing a DataFrame piece by piece copies it every time. If several 
+frames must be combined, collect them in a list and call 
+:func:`pandas.concat` once.
 """
 from __future__ import annotations 
 
+import os
+import zlib
 import pandas as pd
 import numpy as np
-import random
-from datetime import timedelta
-from sklearn.model_selection import train_test_split 
+from concurrent.futures import ThreadPoolExecutor
 from ..tools.baseutils import remove_target_from_array
 from ..tools.box import Boxspace 
 from ..tools.coreutils import ellipsis2false ,assert_ratio, is_iterable 
-from ..tools.coreutils import is_in_if, _assert_all_types,  add_noises_to 
+from ..tools.coreutils import _assert_all_types,  add_noises_to 
 from ..tools.coreutils import smart_format, random_sampling
 from ..tools.funcutils import ensure_pkg
 from ._globals import AFRICAN_COUNTRIES, DIAGNOSIS_UNITS
 from ._globals import COMMON_PESTICIDES, COMMON_CROPS 
 from ._globals import WATER_QUAL_NEEDS, WATER_QUAN_NEEDS, SDG6_CHALLENGES
-from ._globals import ORE_TYPE, EXPLOSIVE_TYPE, EQUIPMENT_TYPE
+from ._globals import ORE_TYPE, EXPLOSIVE_TYPE, EQUIPMENT_TYPE_CANON
+from ._globals import ERT_EQUIPMENT, ERT_EQUIPMENT_SET, TEM_EQUIPMENT
+
+# Draws of at least _PARALLEL_MIN_SIZE values are split in _CHUNK_SIZE
+# chunks, each filled from its own spawned stream.
+_PARALLEL_MIN_SIZE = 1 << 20 
+_CHUNK_SIZE = 1 << 18 
 
 
 def make_classification(
@@ -616,6 +629,7 @@ def make_social_media_comments(
     >>> df = make_social_media_comments(n=100, seed=42)
     >>> print(df.head())
     """
+    samples = int(samples)
     np.random.seed(seed)
  
     from faker import Faker
@@ -704,12 +718,13 @@ def make_african_demo(*,
         The proportion of the dataset to be used as the test set. The default
         is 0.3, meaning 30% of the data is used for testing.
     
-    seed : int, array-like, BitGenerator, np.random.RandomState,\
-        np.random.Generator, optional
+    seed : int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
         Seed for the random number generator. Accepts an integer, array-like, 
-        or BitGenerator for seeding.
-        If an instance of np.random.RandomState or np.random.Generator 
-        is provided, it will be used as is.
+        SeedSequence or BitGenerator for seeding.
+        If an instance of np.random.Generator is provided, it will be used 
+        as is; a np.random.RandomState seeds a new generator. The global 
+        NumPy random state is left untouched.
     
     Returns
     -------
@@ -757,36 +772,33 @@ def make_african_demo(*,
     >>> print(demography_data.head())
 
     """ 
-    # Random seed for reproducibility
-    np.random.seed(seed); data = []
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'african_demo')
     # check the given data 
     start_year = int (_assert_all_types(start_year, int, float, str, 
                       objname="'start_name' parameter "))
     end_year = int (_assert_all_types(end_year, int, float, str, 
                       objname="'start_name' parameter "))
     
-    countries = _get_item_from ( countries, AFRICAN_COUNTRIES, 7  )
-    for year in range(start_year, end_year + 1):
-        for country in countries:
-            population = np.random.randint(1e6, 2e8)  # Random population
-            birth_rate = np.random.uniform(20, 50)  # Births per 1000 people
-            death_rate = np.random.uniform(5, 20)  # Deaths per 1000 people
-            urbanization_rate = np.random.uniform(10, 85)  # Percentage of urban population
-            gdp_per_capita = np.random.uniform(500, 20000)  # USD
-
-            data.append([country, year, population, birth_rate, death_rate,
-                         urbanization_rate, gdp_per_capita])
-    columns = [
-        'country',
-        'year',
-        'population',
-        'birth_rate',
-        'death_rate',
-        'urbanization_rate',
-        'gdp_per_capita'
-    ]
-
-    demo_data = pd.DataFrame(data, columns=columns)
+    countries = _get_item_from ( countries, AFRICAN_COUNTRIES, 7, rng=rng )
+    # One row per (year, country) pair, years varying slowest. Draw each 
+    # column in a single batch rather than row by row.
+    years = np.arange(start_year, end_year + 1, dtype=np.int16)
+    n = len(years) * len(countries)
+    country_codes, country_names = pd.factorize(np.asarray(countries))
+    
+    demo_data = {
+        'country': pd.Categorical.from_codes(
+            np.tile(country_codes, len(years)), country_names),
+        'year': np.repeat(years, len(countries)),
+        'population': rng.integers(int(1e6), int(2e8), n, dtype=np.int32), 
+        # Births and deaths per 1000 people
+        'birth_rate': _uniform(rng, 20, 50, n), 
+        'death_rate': _uniform(rng, 5, 20, n), 
+        # Percentage of urban population
+        'urbanization_rate': _uniform(rng, 10, 85, n), 
+        'gdp_per_capita': _uniform(rng, 500, 20000, n) # USD
+    }
   
     target_names = list( is_iterable(
         target_names or 'gdp_per_capita', exclude_string= True, transform =True ) ) 
@@ -867,10 +879,12 @@ def make_agronomy_feedback(*,
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -920,54 +934,48 @@ def make_agronomy_feedback(*,
     >>> print(agronomy_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'agronomy_feedback')
     n_specimens = int(_assert_all_types(n_specimens, int, float,
                 objname='The number of specimens (crop and pesticides)')
         )
     
-    pesticide_types = random.sample(COMMON_PESTICIDES, n_specimens)
-    crop_types = random.sample(COMMON_CROPS, n_specimens)
-    data = []
-    for entry_id in range(samples):
-        for year in range(num_years):
-            for crop in crop_types:
-                # Soil pH value
-                soil_ph = np.random.uniform(4.0, 9.0)  
-                # Average annual temperature in Celsius
-                temperature = np.random.uniform(10, 35) 
-                # Annual rainfall in mm
-                rainfall = np.random.uniform(200, 2000)  
-                pesticide = random.choice(pesticide_types)
-                # Pesticide amount in kg/hectare
-                pesticide_amount = np.random.uniform(0.1, 10) 
-                # Crop yield in kg/hectare
-                crop_yield = np.random.uniform(100, 10000)  
-
-                data.append([entry_id, 
-                             year, 
-                             crop, 
-                             soil_ph, 
-                             temperature, 
-                             rainfall, 
-                             pesticide, 
-                             pesticide_amount, 
-                             crop_yield]
-                            )
-
-    columns = [
-        'farm_id',
-        'year',
-        'crop',
-        'soil_ph',
-        'temperature_c',
-        'rainfall_mm',
-        'pesticide_type',
-        'pesticide_amount_kg_per_hectare',
-        'crop_yield_kg_per_hectare'
-    ]
-
-    agronomy_dataset = pd.DataFrame(data, columns=columns)
+    pesticide_types = rng.choice(
+        COMMON_PESTICIDES, n_specimens, replace=False).tolist()
+    crop_types = rng.choice(COMMON_CROPS, n_specimens, replace=False).tolist()
+    # One row per (farm, year, crop) triple, farms varying slowest. Each 
+    # column is drawn in a single batch.
+    n_crops = len(crop_types)
+    n = samples * num_years * n_crops
+    farm_ids = np.repeat(np.arange(samples), num_years * n_crops)
+    years = np.tile(np.repeat(np.arange(num_years, dtype=np.int16), n_crops),
+                    samples)
+    crops = pd.Categorical.from_codes(
+        np.tile(np.arange(n_crops), samples * num_years), crop_types)
+    # Soil pH value
+    soil_ph = _uniform(rng, 4.0, 9.0, n)  
+    # Average annual temperature in Celsius
+    temperature = _uniform(rng, 10, 35, n) 
+    # Annual rainfall in mm
+    rainfall = _uniform(rng, 200, 2000, n)  
+    pesticides = _choice_categorical(rng, pesticide_types, n)
+    # Pesticide amount in kg/hectare
+    pesticide_amount = _uniform(rng, 0.1, 10, n) 
+    # Crop yield in kg/hectare
+    crop_yield = _uniform(rng, 100, 10000, n)  
+
+    agronomy_dataset = pd.DataFrame({
+        'farm_id': farm_ids,
+        'year': years,
+        'crop': crops,
+        'soil_ph': soil_ph,
+        'temperature_c': temperature,
+        'rainfall_mm': rainfall,
+        'pesticide_type': pesticides,
+        'pesticide_amount_kg_per_hectare': pesticide_amount,
+        'crop_yield_kg_per_hectare': crop_yield
+    })
     target_names = list( is_iterable(
         target_names or 'crop_yield_kg_per_hectare',exclude_string= True,
         transform =True ) ) 
@@ -1050,8 +1058,8 @@ def make_mining_ops(
       effective yet safe.
     
     - EquipmentType: The type of equipment being used in the mining 
-      operation (e.g., Excavator, Drill, Loader, Truck). Different equipment 
-      is used for different phases of mining.
+      operation (e.g., Excavators, Drilling Rigs, Loaders, Dump Trucks). 
+      Different equipment is used for different phases of mining.
     
     - EquipmentAge_years: The age of the equipment being used, in years. 
       Older equipment might be less efficient or more prone to breakdowns.
@@ -1095,10 +1103,12 @@ def make_mining_ops(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -1147,33 +1157,37 @@ def make_mining_ops(
     >>> print(mining_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
-    
-    # Geospatial data for drilling locations
-    eastings = np.random.uniform(0, 1000, samples)  # in meters
-    northings = np.random.uniform(0, 1000, samples)  # in meters
-    depths = np.random.uniform(0, 500, samples)  # in meters
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'mining_ops')
+    
+    # All continuous measures come from one (8, samples) uniform draw, 
+    # each row rescaled to its own (low, high) range.
+    bounds = np.array([
+        (0, 1000),     # easting in meters
+        (0, 1000),     # northing in meters
+        (0, 500),      # depth in meters
+        (0.1, 20),     # ore concentration in percentage
+        (50, 200),     # drill diameter in mm
+        (3, 15),       # blast hole depth in meters
+        (10, 500),     # explosive amount in kg
+        (1000, 10000), # daily production in tonnes
+        ], dtype=np.float32)
+    (eastings, northings, depths, ore_concentrations, drill_diameters, 
+     blast_hole_depths, explosive_amounts, daily_productions) = _uniform(
+         rng, bounds[:, :1], bounds[:, 1:], (len(bounds), samples))
 
     # Mineralogical data
-    ore_types = np.random.choice(list(ORE_TYPE.keys()), samples)
-    ore_concentrations = np.random.uniform(0.1, 20, samples)  # percentage
+    ore_types = _choice_categorical(rng, ORE_TYPE.labels, samples)
 
     # Drilling and blasting data
-    drill_diameters = np.random.uniform(50, 200, samples)  # in mm
-    blast_hole_depths = np.random.uniform(3, 15, samples)  # in meters
-    explosive_types = np.random.choice(list(EXPLOSIVE_TYPE.keys()), samples)
-    explosive_amounts = np.random.uniform(10, 500, samples)  # in kg
+    explosive_types = _choice_categorical(rng, EXPLOSIVE_TYPE.labels, samples)
 
     # Equipment details
-    equipment_types = np.random.choice(EQUIPMENT_TYPE, samples)
-    equipment_ages = np.random.randint(0, 15, samples)  # in years
+    equipment_types = _choice_categorical(rng, EQUIPMENT_TYPE_CANON, samples)
+    equipment_ages = rng.integers(0, 15, samples, dtype=np.int8)  # in years
 
-    # Production figures
-    daily_productions = np.random.uniform(1000, 10000, samples)  # in tonnes
-
-    # Construct the DataFrame
-    mining_data = pd.DataFrame({
+    mining_data = {
         'easting_m': eastings,
         'northing_m': northings,
         'depth_m': depths,
@@ -1186,17 +1200,12 @@ def make_mining_ops(
         'equipment_type': equipment_types,
         'equipment_age_years': equipment_ages,
         'daily_production_tonnes': daily_productions
-    })
+    }
 
     target_names = list (is_iterable ( 
         target_names or 'daily_production_tonnes',
         exclude_string= True, transform =True )
         )
-    # map to make it a little bit real.
-    for typ, rtype  in zip ( ("ore_type", "explosive_type"), 
-                       (ORE_TYPE, EXPLOSIVE_TYPE )) : 
-        mining_data[typ] = mining_data[typ].map (rtype) 
-        
     # resample to fit the number of samples 
     mining_data = _manage_data(
         mining_data,
@@ -1274,10 +1283,12 @@ def make_sounding(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -1327,27 +1338,18 @@ def make_sounding(
     >>> print(sounding_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
-    
-    # Initializing lists to hold data
-    survey_point_ids = []
-    layer_depths = []
-    resistivities = []
-    velocities = []
-
-    for point_id in range(samples):
-        depth = 0
-        for layer in range(num_layers):
-            # Simulate layer depth increment and properties
-            depth += np.random.uniform(1, 10)  # Depth increment in meters
-            resistivity = np.random.uniform(10, 1000)  # Resistivity in ohm-meter
-            velocity = np.random.uniform(500, 5000)  # Seismic wave velocity in m/s
-
-            survey_point_ids.append(point_id)
-            layer_depths.append(depth)
-            resistivities.append(resistivity)
-            velocities.append(velocity)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'sounding')
+    
+    n = samples * num_layers
+    survey_point_ids = np.repeat(np.arange(samples), num_layers)
+    # Layer depths are the running sum of the depth increments (1-10 m)
+    # along each survey point.
+    layer_depths = np.cumsum(
+        _uniform(rng, 1, 10, (samples, num_layers)), axis=1).ravel()
+    resistivities = _uniform(rng, 10, 1000, n)  # Resistivity in ohm-meter
+    velocities = _uniform(rng, 500, 5000, n)  # Seismic wave velocity in m/s
 
     # Constructing the DataFrame
     sounding_data = pd.DataFrame({
@@ -1428,10 +1430,12 @@ def make_medical_diagnosis(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
       
     Returns
     -------
@@ -1481,79 +1485,69 @@ def make_medical_diagnosis(
     >>> medical_data.feature_units 
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
-    
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'medical_diagnosis')
+    
+    # Continuous measures come from one uniform draw, each row rescaled 
+    # to its own (low, high) range.
+    bounds = np.array([
+        (50, 120),    # weight in kilograms
+        (150, 200),   # height in centimeters
+        (36.5, 38.0), # temperature in Celsius
+        (70, 150),    # blood sugar in mg/dL
+        (100, 250),   # cholesterol in mg/dL
+        (12, 18),     # hemoglobin in g/dL
+        (95, 100),    # oxygen saturation, normal range
+        (7, 56),      # ALT levels in U/L
+        (0.5, 1.2),   # creatinine in mg/dL
+        (4.0, 11.0),  # WBC count in x10^3/uL
+        (18.5, 30),   # BMI range
+        (4, 10),      # sleep hours per night, normal range
+        ])
+    (weights, heights, temperatures, blood_sugars, cholesterol_levels, 
+     hemoglobins, oxygen_saturation, alt_levels, creatinine_levels, 
+     wbc_count, bmi, sleep_hours_per_night) = _uniform(
+         rng, bounds[:, :1], bounds[:, 1:], (len(bounds), samples))
+    
+    # Binary flags (0 or 1) of the medical history, lifestyle, social 
+    # determinants and immunization status, drawn at once.
+    (history_of_diabetes, history_of_hypertension, history_of_heart_disease, 
+     dietary_restrictions, smoking_status, alcohol_consumption, 
+     mental_health_status, history_of_chronic_diseases, 
+     family_history_of_major_diseases, allergy_flags, employment_status, 
+     access_to_healthcare, flu_vaccine, covid_19_vaccine, other_vaccines
+     ) = rng.integers(0, 2, (15, samples), dtype=np.uint8)
+
     # Demographic information
-    ages = np.random.randint(0, 100, samples)
-    genders = np.random.choice(['Male', 'Female'], samples)
-    
-    ethnicities = np.random.choice(WATER_QUAL_NEEDS['Ethnicity'], samples)
-    weights = np.random.uniform(50, 120, samples)  # in kilograms
-    heights = np.random.uniform(150, 200, samples)  # in centimeters
-
-    # Vital signs
-    blood_pressures = np.random.randint(90, 180, size=(samples, 2)) 
-    # systolic and diastolic
-    heart_rates = np.random.randint(60, 100, samples)
-    temperatures = np.random.uniform(36.5, 38.0, samples)  # in Celsius
-
-    # Laboratory test results
-    blood_sugars = np.random.uniform(70, 150, samples)  # mg/dL
-    cholesterol_levels = np.random.uniform(100, 250, samples)  # mg/dL
-    hemoglobins = np.random.uniform(12, 18, samples)  # g/dL
-
-    # Medical history flags (binary: 0 or 1)
-    history_of_diabetes = np.random.randint(0, 2, samples)
-    history_of_hypertension = np.random.randint(0, 2, samples)
-    history_of_heart_disease = np.random.randint(0, 2, samples)
-    # Additional Vital Signs
-    respiratory_rate = np.random.randint(12, 20, samples)  # Normal range
-    oxygen_saturation = np.random.uniform(95, 100, samples)  # Normal range
-    pain_score = np.random.randint(0, 11, samples)  # Scale from 0 to 10
-    
-    # Extended Laboratory Tests (Simplified example values)
-    alt_levels = np.random.uniform(7, 56, samples)  # ALT levels in U/L
-    creatinine_levels = np.random.uniform(0.5, 1.2, samples)  # Creatinine in mg/dL
-    wbc_count = np.random.uniform(4.0, 11.0, samples)  # WBC count in x10^3/uL
-    
-    # Nutritional Status
-    bmi = np.random.uniform(18.5, 30, samples)  # BMI range
-    daily_caloric_intake = np.random.randint(1500, 3000, samples)  # Example caloric intake
-    dietary_restrictions = np.random.randint(0, 2, samples)  # Binary flag for dietary restrictions
-    
-    # Lifestyle Factors
-    physical_activity_level = np.random.choice(
-        ['sedentary', 'light', 'moderate', 'high'], samples)
-    smoking_status = np.random.randint(0, 2, samples)  # Binary
-    alcohol_consumption = np.random.randint(0, 2, samples)  # Binary
+    ages = rng.integers(0, 100, samples)
+    genders = _choice_categorical(rng, ['Male', 'Female'], samples)
+    ethnicities = _choice_categorical(
+        rng, WATER_QUAL_NEEDS['Ethnicity'], samples)
+
+    # Vital signs: systolic and diastolic blood pressure, heart rate
+    blood_pressures = rng.integers(90, 180, size=(samples, 2)) 
+    heart_rates = rng.integers(60, 100, samples)
+    respiratory_rate = rng.integers(12, 20, samples)  # Normal range
+    pain_score = rng.integers(0, 11, samples)  # Scale from 0 to 10
+    
+    # Nutritional status and lifestyle
+    daily_caloric_intake = rng.integers(1500, 3000, samples)  # Example caloric intake
+    physical_activity_level = _choice_categorical(
+        rng, ['sedentary', 'light', 'moderate', 'high'], samples)
     
     # Psychological/Well-being Metrics
-    stress_level = np.random.randint(0, 11, samples)  # Scale from 0 to 10
-    sleep_hours_per_night = np.random.uniform(4, 10, samples)  # Normal sleep duration range
-    mental_health_status = np.random.randint(0, 2, samples)  # Binary flag for common mental health conditions
+    stress_level = rng.integers(0, 11, samples)  # Scale from 0 to 10
     
-    # Medical History Details
-    history_of_chronic_diseases = np.random.randint(0, 2, samples)  # Binary flag for chronic diseases
-    number_of_surgeries = np.random.randint(0, 5, samples)  # Number of surgeries
-    family_history_of_major_diseases = np.random.randint(0, 2, samples)  # Binary flag for family history
-    
-    # Current Medications and Allergies
-    number_of_current_medications = np.random.randint(0, 10, samples)  # Number of medications
-    allergy_flags = np.random.randint(0, 2, samples)  # Binary flag for common allergies
+    # Medical history details, current medications
+    number_of_surgeries = rng.integers(0, 5, samples)  # Number of surgeries
+    number_of_current_medications = rng.integers(0, 10, samples)  # Number of medications
     
     # Social Determinants of Health
-    employment_status = np.random.randint(0, 2, samples)  # Binary
-    living_situation = np.random.choice(['alone', 'with_family', 'in_care_facility'], samples)
-    access_to_healthcare = np.random.randint(0, 2, samples)  # Binary
-    
-    # Immunization Status
-    flu_vaccine = np.random.randint(0, 2, samples)  # Binary
-    covid_19_vaccine = np.random.randint(0, 2, samples)  # Binary
-    other_vaccines = np.random.randint(0, 2, samples)  # Binary flag for other vaccines
+    living_situation = _choice_categorical(
+        rng, ['alone', 'with_family', 'in_care_facility'], samples)
     
-    # Combining all features into a DataFrame 
-    medical_dataset = pd.DataFrame({
+    medical_dataset = {
         'age': ages,
         'gender': genders,
         'ethnicity': ethnicities,
@@ -1595,7 +1589,7 @@ def make_medical_diagnosis(
         'flu_vaccine': flu_vaccine,
         'covid_19_vaccine': covid_19_vaccine,
         'other_vaccines': other_vaccines
-    })
+    }
 
     target_names = list (is_iterable (target_names or [
         'history_of_diabetes','history_of_hypertension','history_of_heart_disease'],
@@ -1610,7 +1604,7 @@ def make_medical_diagnosis(
         test_size=test_size,
         noise= noise, 
         seed=seed, 
-        feature_units=DIAGNOSIS_UNITS
+        feature_units=dict(DIAGNOSIS_UNITS)
         ) 
 
 
@@ -1674,10 +1668,12 @@ def make_well_logging(*,
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -1728,25 +1724,33 @@ def make_well_logging(*,
     >>> print(well_logging_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
-    
-    depths = np.arange(depth_start, depth_end, depth_interval)
-
-    # Simulating geophysical measurements
-    gamma_ray = np.random.uniform(20, 150, len(depths))  # Gamma-ray (API units)
-    resistivity = np.random.uniform(0.2, 200, len(depths))  # Resistivity (ohm-m)
-    neutron_porosity = np.random.uniform(15, 45, len(depths))  # Neutron porosity (%)
-    density = np.random.uniform(1.95, 2.95, len(depths))  # Bulk density (g/cm³)
-
-    # Construct the DataFrame
-    well_logging_dataset = pd.DataFrame({
-        'depth_m': depths,
-        'gamma_ray_api': gamma_ray,
-        'resistivity_ohm_meter': resistivity,
-        'neutron_porosity_percent': neutron_porosity,
-        'density_g_cm3': density
-    })
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'well_logging')
+    
+    # Depths from an integer count rather than a float-step arange, which 
+    # can gain or lose a sample to rounding. Rounding the ratio first keeps 
+    # the arange length when the interval divides the range exactly.
+    n = int(np.ceil(round((depth_end - depth_start) / depth_interval, 9)))
+    depths = np.arange(n, dtype=np.float32) * np.float32(depth_interval)
+    depths += np.float32(depth_start)
+
+    # Simulating geophysical measurements: one uniform draw rescaled per 
+    # log, handed to pandas as a single 2D block.
+    bounds = np.array([
+        (20, 150),    # Gamma-ray (API units)
+        (0.2, 200),   # Resistivity (ohm-m)
+        (15, 45),     # Neutron porosity (%)
+        (1.95, 2.95), # Bulk density (g/cm³)
+        ])
+    logs = _uniform(rng, bounds[:, :1], bounds[:, 1:], (len(bounds), n))
+
+    well_logging_dataset = {
+        'depth_m': depths, 
+        'gamma_ray_api': logs[0], 
+        'resistivity_ohm_meter': logs[1], 
+        'neutron_porosity_percent': logs[2], 
+        'density_g_cm3': logs[3]
+    }
     target_names = list (is_iterable ( 
         target_names or 'neutron_porosity_percent', exclude_string= True,
         transform =True )
@@ -1825,10 +1829,12 @@ def make_ert(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -1883,29 +1889,32 @@ def make_ert(
     >>> print(ert_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'ert')
     
-    if equipment_type not in ['SuperSting R8', 'Ministing or Sting R1', 
-                              'OhmMapper']:
-        raise ValueError("equipment_type must be one of 'SuperSting R8'," 
-                         "'Ministing or Sting R1', or 'OhmMapper'")
+    if equipment_type not in ERT_EQUIPMENT_SET:
+        raise ValueError("equipment_type must be one of "
+                         f"{smart_format(ERT_EQUIPMENT, 'or')}")
 
     # Generate synthetic data
-    electrode_positions = np.random.uniform(0, 100, samples)  # in meters
-    cable_lengths = np.random.choice([20, 50, 100], samples)  # in meters
-    resistivity_measurements = np.random.uniform(10, 1000, samples)  # in ohm-meter
-    battery_voltage = np.random.choice(
-        [12], samples) if equipment_type != 'OhmMapper' else np.nan  # in V
-
-    # Construct the DataFrame
-    ert_dataset = pd.DataFrame({
+    electrode_positions = _uniform(rng, 0, 100, samples)  # in meters
+    cable_lengths = rng.choice([20, 50, 100], samples)  # in meters
+    resistivity_measurements = _uniform(rng, 10, 1000, samples)  # in ohm-meter
+    # Constant 12 V battery; the OhmMapper has none.
+    battery_voltage = (np.full(samples, 12, dtype=np.int8) 
+                       if equipment_type != 'OhmMapper' 
+                       else np.full(samples, np.nan, dtype=np.float32))
+
+    ert_dataset = {
         'electrode_position_m': electrode_positions,
         'cable_length_m': cable_lengths,
         'resistivity_ohm_meter': resistivity_measurements,
         'battery_voltage_v': battery_voltage,
-        'equipment_type': equipment_type
-    })
+        # One int8 code per row rather than a column of string pointers.
+        'equipment_type': pd.Categorical.from_codes(
+            np.zeros(samples, dtype=np.int8), [equipment_type])
+    }
 
     target_names = list (is_iterable ( 
         target_names or 'resistivity_ohm_meter', exclude_string= True, transform =True )
@@ -1924,7 +1933,7 @@ def make_ert(
 
 def make_tem(
     *, 
-    samples=500., 
+    samples=500, 
     lat_range=(34.00, 36.00), 
     lon_range=(-118.50, -117.00), 
     time_range=(0.01, 10.0), 
@@ -1984,10 +1993,12 @@ def make_tem(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -2041,31 +2052,29 @@ def make_tem(
     >>> print(tem_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
-    
-    # Equipment types
-    equipment_types = [
-        'Stratagem EH5-Geometric', 'IRIS Remote Field Probes',
-        'Phoenix Atlas RTM System', 'Zonge GDP 24-bit Receiver']
-
-    # Generate random geospatial data
-    latitudes = np.random.uniform(lat_range[0], lat_range[1], samples)
-    longitudes = np.random.uniform(lon_range[0], lon_range[1], samples)
-
-    # Generate time intervals, measurements, and equipment types
-    times = np.random.uniform(time_range[0], time_range[1], samples)
-    measurements = np.random.uniform(measurement_range[0], measurement_range[1], samples)
-    equipment = np.random.choice(equipment_types, samples)
-
-    # Construct the DataFrame
-    tem_survey_data = pd.DataFrame({
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'tem')
+    
+    # Geospatial data keep double precision; time intervals and 
+    # measurements fit in single precision. Each group comes from one 
+    # uniform draw, each row rescaled to its own range.
+    bounds = np.array([lat_range, lon_range], dtype=np.float64)
+    latitudes, longitudes = _uniform(
+        rng, bounds[:, :1], bounds[:, 1:], (len(bounds), samples), 
+        dtype=np.float64)
+    bounds = np.array([time_range, measurement_range], dtype=np.float32)
+    times, measurements = _uniform(
+        rng, bounds[:, :1], bounds[:, 1:], (len(bounds), samples))
+    equipment = _choice_categorical(rng, TEM_EQUIPMENT, samples)
+
+    tem_survey_data = {
         'latitude': latitudes,
         'longitude': longitudes,
         'time_ms': times,
         'tem_measurement': measurements,
         'equipment_type': equipment
-    })
+    }
     target_names = list (is_iterable ( 
         target_names or 'tem_measurement', exclude_string= True, transform =True )
         )
@@ -2147,10 +2156,12 @@ def make_erp(*,
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -2203,27 +2214,30 @@ def make_erp(*,
     >>> print(dataset.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'erp')
     
     # Generate random geospatial data
-    latitudes = np.random.uniform(lat_range[0], lat_range[1], samples)
-    longitudes = np.random.uniform(lon_range[0], lon_range[1], samples)
+    latitudes = rng.uniform(lat_range[0], lat_range[1], samples)
+    longitudes = rng.uniform(lon_range[0], lon_range[1], samples)
 
-    # Convert lat/lon to easting/northing (simplified, for example purposes)
-    eastings = (longitudes - lon_range[0]) * 100000
-    northings = (latitudes - lat_range[0]) * 100000
+    # Convert lat/lon to easting/northing (simplified, for example purposes).
+    # Scale in place to avoid a second temporary per axis.
+    eastings = longitudes - lon_range[0]
+    eastings *= 100000
+    northings = latitudes - lat_range[0]
+    northings *= 100000
 
     # Positions and steps
-    positions = np.arange(1, samples + 1)
-    steps = np.random.randint(1, 10, samples)
+    positions = np.arange(1, samples + 1, dtype=np.int32)
+    steps = rng.integers(1, 10, samples)
 
     # Generate resistivity values
-    resistivities = np.random.uniform(
+    resistivities = rng.uniform(
         resistivity_range[0], resistivity_range[1], samples)
 
-    # Construct the DataFrame
-    data = pd.DataFrame({
+    data = {
         'easting': eastings,
         'northing': northings,
         'longitude': longitudes,
@@ -2231,7 +2245,7 @@ def make_erp(*,
         'position': positions,
         'step': steps,
         'resistivity': resistivities
-    })
+    }
     target_names = list (is_iterable ( 
         target_names or 'resistivity', exclude_string= True, transform =True )
         )
@@ -2277,7 +2291,8 @@ def make_elogging(
         The number of log entries to generate.
 
     log_levels : list of str, optional
-        A list of log levels (e.g., ['INFO', 'WARNING', 'ERROR']). 
+        A list of log levels (e.g., ['INFO', 'WARNING', 'ERROR']). A level 
+        listed several times is drawn proportionally more often.
         If None, defaults to ['INFO', 'DEBUG', 'WARNING', 'ERROR', 'CRITICAL'].
 
     as_frame : bool, default=False
@@ -2305,10 +2320,12 @@ def make_elogging(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -2360,30 +2377,34 @@ def make_elogging(
     >>> print(log_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'elogging')
     
     if log_levels is None:
         log_levels = ['INFO', 'DEBUG', 'WARNING', 'ERROR', 'CRITICAL']
 
-    # Generate random timestamps within the given range
+    # Generate random timestamps within the given range, drawn as second 
+    # offsets and sorted so the log reads in time order.
     start_timestamp = pd.to_datetime(start_date)
     end_timestamp = pd.to_datetime(end_date)
-    timestamps = [start_timestamp + timedelta(
-        seconds=random.randint(0,int((end_timestamp - start_timestamp
-                                      ).total_seconds()))) 
-        for _ in range(samples)
-        ]
-
-    # Generate random log levels and messages
-    levels = [random.choice(log_levels) for _ in range(samples)]
-    messages = [f'This is a {level} message.' for level in levels]
+    span = int((end_timestamp - start_timestamp).total_seconds())
+    offsets = np.sort(rng.integers(0, span + 1, samples))
+    timestamps = _offset_dates(start_timestamp, offsets, 's')
+
+    # Generate random log levels and messages from the same level codes.
+    # Repeated levels are factorized so the categories stay unique.
+    codes = rng.integers(0, len(log_levels), samples)
+    level_codes, unique_levels = pd.factorize(np.asarray(log_levels))
+    codes = level_codes[codes]
+    levels = pd.Categorical.from_codes(codes, unique_levels)
+    messages = pd.Categorical.from_codes(
+        codes, [f'This is a {level} message.' for level in unique_levels])
 
     # Create DataFrame
     log_data = pd.DataFrame({'timestamp': timestamps,
                              'log_level': levels, 
                              'message': messages})
-    log_data.sort_values(by='timestamp', inplace=True)
     
     target_names = list (is_iterable ( 
         target_names or 'log_level', exclude_string= True, transform =True )
@@ -2460,10 +2481,12 @@ def make_gadget_sales(*,
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
     Returns
     -------
@@ -2515,22 +2538,25 @@ def make_gadget_sales(*,
     >>> print(sales_data.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'gadget_sales')
     
     gadget_types = ['Smartphone', 'Tablet', 'Laptop', 'Smartwatch', 'Headphones']
     genders = ['Girl', 'Boy']
 
-    # Generate random sale dates within the given range
+    # Generate random sale dates within the given range, drawn as day 
+    # offsets and sorted so the sales read in date order.
     start_timestamp = pd.to_datetime(start_date)
     end_timestamp = pd.to_datetime(end_date)
-    sale_dates = [start_timestamp + timedelta(days=random.randint(
-        0, (end_timestamp - start_timestamp).days)) for _ in range(samples)]
+    days = np.sort(rng.integers(
+        0, (end_timestamp - start_timestamp).days + 1, samples))
+    sale_dates = _offset_dates(start_timestamp, days, 'D')
 
     # Generate random gadget types, genders, and units sold
-    gadgets = [random.choice(gadget_types) for _ in range(samples)]
-    gender = [random.choice(genders) for _ in range(samples)]
-    units_sold = [random.randint(1, 20) for _ in range(samples)]
+    gadgets = _choice_categorical(rng, gadget_types, samples)
+    gender = _choice_categorical(rng, genders, samples)
+    units_sold = rng.integers(1, 21, samples)
 
     # Create DataFrame
     sales_data = pd.DataFrame({
@@ -2539,7 +2565,6 @@ def make_gadget_sales(*,
                 'gender': gender,
                 'units_sold': units_sold
             })
-    sales_data.sort_values(by='sale_date', inplace=True)
     
     target_names = list (is_iterable ( 
         target_names or 'units_sold', exclude_string= True, transform =True )
@@ -2614,10 +2639,12 @@ def make_retail_store(
         The ratio to split the data into training (X, y)  and testing (Xt, yt) set 
         respectively. 
         
-    seed: int, array-like, BitGenerator, np.random.RandomState, \
-        np.random.Generator, optional
-       If int, array-like, or BitGenerator, seed for random number generator. 
-       If np.random.RandomState or np.random.Generator, use as given.
+    seed: int, array-like, BitGenerator, SeedSequence, \
+        np.random.RandomState, np.random.Generator, optional
+       If int, array-like, SeedSequence or BitGenerator, seed for random 
+       number generator. If np.random.Generator, use as given; a 
+       np.random.RandomState seeds a new generator. The global NumPy random 
+       state is left untouched.
        
        
     Returns
@@ -2666,29 +2693,42 @@ def make_retail_store(
     >>> print(dataset.head())
 
     """
-    # Random seed for reproducibility
-    np.random.seed(seed)
+    samples = int(samples)
+    # Random generator for reproducibility
+    rng, seed = _check_seed(seed, 'retail_store')
 
     # Generating numerical data
-    ages = np.random.randint(18, 70, size=samples)
-    incomes = np.random.normal(50000, 15000, samples).clip(20000, 100000)
-    shopping_frequency = np.random.randint(1, 10, size=samples)  # frequency per month
-    last_purchase_amount = np.random.exponential(100, samples).clip(10, 500)
+    # Drawn in the narrowest dtypes holding them; normal and exponential 
+    # values are scaled in place from the float32 standard draws.
+    ages = rng.integers(18, 70, size=samples, dtype=np.int8)
+    incomes = rng.standard_normal(samples, dtype=np.float32)
+    incomes *= 15000
+    incomes += 50000
+    np.clip(incomes, 20000, 100000, out=incomes)
+    shopping_frequency = rng.integers(1, 10, size=samples, dtype=np.int8)  # frequency per month
+    last_purchase_amount = rng.standard_exponential(samples, dtype=np.float32)
+    last_purchase_amount *= 100
+    np.clip(last_purchase_amount, 10, 500, out=last_purchase_amount)
 
     # Generating categorical data
     categories = ['Electronics', 'Fashion', 'Home & Garden', 'Sports', 
                   'Health & Beauty']
-    preferred_category = np.random.choice(categories, size=samples)
+    preferred_category = _choice_categorical(rng, categories, samples)
 
     # Generating target variable (binary)
-    # Here, we can simulate some complex relationships
-    likelihood_to_respond = (0.3 * np.random.normal(size=samples) +
-                             0.1 * (ages / 70) +
-                             0.2 * (incomes / 100000) +
-                             0.3 * (shopping_frequency / 10) -
-                             0.1 * (last_purchase_amount / 500))
-    target = (likelihood_to_respond > np.random.normal(0.5, 0.1, samples)
-              ).astype(int)
+    # Here, we can simulate some complex relationships. Each weighted term 
+    # is computed into one reused float32 buffer, then added in place.
+    likelihood_to_respond = rng.standard_normal(samples, dtype=np.float32)
+    likelihood_to_respond *= 0.3
+    term = np.empty(samples, dtype=np.float32)
+    for values, scale in ((ages, 70 / 0.1), (incomes, 100000 / 0.2), 
+                          (shopping_frequency, 10 / 0.3)): 
+        np.divide(values, scale, out=term, dtype=np.float32)
+        likelihood_to_respond += term
+    np.divide(last_purchase_amount, 500 / 0.1, out=term, dtype=np.float32)
+    likelihood_to_respond -= term
+    target = (likelihood_to_respond > rng.normal(0.5, 0.1, samples)
+              ).astype(np.int8)
 
     # Construct the DataFrame
     data = pd.DataFrame({
@@ -2818,6 +2858,7 @@ def make_cc_factors(
     >>> print(f"Dataset shape: {climate_change_data.shape}")
     >>> print(f"Sample data:\n{climate_change_data[:5]}")
     """
+    samples = int(samples)
 
     # Features influencing climate change
     features = {
@@ -2997,6 +3038,7 @@ def make_water_demand(
 
      [700 rows x 39 columns]
     """
+    samples = int(samples)
     # Random seed for reproducibility
     np.random.seed(seed)
     
@@ -3007,14 +3049,17 @@ def make_water_demand(
     for feature in WATER_QUAN_NEEDS.keys():
         data_dict[feature] = np.random.uniform(0, 100, samples)
 
-    # Generate synthetic data for categorical features
-    WATER_QUAL_NEEDS ["Economic Status"]= np.random.uniform(
-        1000, 50000, samples).round(2)
+    # Generate synthetic data for categorical features. The economic 
+    # status is drawn here rather than stored back into the shared 
+    # read-only WATER_QUAL_NEEDS mapping.
+    economic_status = np.random.uniform(1000, 50000, samples).round(2)
 
     for feature, possible_values in WATER_QUAL_NEEDS.items():
         # first skip when feature is Region to compute later 
         if feature =='Region': 
             continue 
+        if feature =='Economic Status': 
+            possible_values = economic_status 
         data_dict[feature] = np.random.choice(possible_values, samples)
 
     # now get the feature Ehnicity and found 
@@ -3150,8 +3195,12 @@ def _manage_data(
     
     Parameters
     -----------
-    data: Pd.DataFrame 
-        The dataset to manage 
+    data: Pd.DataFrame or dict of array-like
+        The dataset to manage. A dict maps column names to equal length 
+        columns; the DataFrame is then built only if the output needs it, 
+        the plain ``(X, y)`` arrays being stacked straight from the columns 
+        with :func:`_stack_columns`. Generators therefore pass their columns 
+        as a dict rather than building a frame up front.
 
     as_frame : bool, default=False
         If True, the data is a pandas DataFrame including columns with
@@ -3226,25 +3275,39 @@ def _manage_data(
         samples.
     
     """
-    y =None, 
+    y =None 
     as_frame, return_X_y, split_X_y = ellipsis2false(
         as_frame, return_X_y, split_X_y )
     
+    if isinstance (data, dict): 
+        if ( return_X_y and target_names and noise is None 
+            and not as_frame and not split_X_y 
+            ): 
+            feature_names = [c for c in data if c not in target_names]
+            return ( _stack_columns(data, feature_names), 
+                    _stack_columns(data, target_names) )
+        data = pd.DataFrame(data)
+        
     frame = data.copy() 
     
-    feature_names = (is_in_if(list( frame.columns), target_names, return_diff =True )
-                     if target_names else list(frame.columns ))
-    if return_X_y : 
+    # Kept in column order, unlike the set difference of `is_in_if`.
+    feature_names = ([c for c in frame.columns if c not in target_names]
+                     if target_names else frame.columns.to_list())
+    if return_X_y or split_X_y: 
         y = data [target_names] 
         data.drop( columns = target_names, inplace =True )
  
     # Noises only in the data not in target  
     data = add_noises_to(data, noise = noise , seed=seed )
     if not as_frame: 
-        data = np.array (data )
-        y = np.array(y ) 
+        # A view of the values whenever the frame holds a single block
+        data = _writable_values(data)
+        if y is not None: 
+            y = _writable_values(y) 
             
     if split_X_y: 
+        # Imported here so that only the split path depends on it.
+        from sklearn.model_selection import train_test_split 
         return train_test_split ( 
             data, y , test_size =assert_ratio (test_size),
             random_state=seed) 
@@ -3252,8 +3315,11 @@ def _manage_data(
     if return_X_y : 
         return data, y 
     
-    frame [feature_names] = add_noises_to( 
-        frame [feature_names], noise =noise, seed=seed  )
+    # Writing the features back column by column splits the frame into 
+    # one block per column, so only do it when there is noise to add.
+    if noise is not None: 
+        frame [feature_names] = add_noises_to( 
+            frame [feature_names], noise =noise, seed=seed  )
     if as_frame:
         return frame
     
@@ -3266,7 +3332,132 @@ def _manage_data(
         **kws
         )
  
-def _get_item_from ( spec , /,  default_items, default_number = 7 ): 
+def _writable_values(obj): 
+    """ Return the values of a DataFrame or Series as a writable array. 
+    
+    The values are a view whenever possible, but under pandas copy-on-write 
+    such views are read-only; they are then copied so callers can still 
+    edit the returned arrays in place. 
+    """
+    values = obj.to_numpy(copy=False)
+    if not values.flags.writeable: 
+        values = values.copy()
+    return values 
+
+def _stack_columns(columns, names): 
+    """ Stack the named `columns` into a 2D array. 
+    
+    This is the ``(X, y)`` fast path of :func:`_manage_data` for datasets 
+    given as a dict of columns, which never builds a DataFrame. 
+    The result matches ``np.array(pd.DataFrame(columns)[names])``: numeric 
+    columns are promoted to their common dtype, while categorical or 
+    string columns give an object array of labels. 
+    """
+    if not names: 
+        return np.empty((len(next(iter(columns.values()))), 0))
+    arrays = [np.asarray(columns[name]) for name in names]
+    stacked = np.empty((len(arrays[0]), len(arrays)), 
+                       dtype=np.result_type(*arrays))
+    for k, values in enumerate(arrays): 
+        stacked[:, k] = values
+    return stacked
+
+def _check_seed(seed, name=None): 
+    """ Build the random generator used by a dataset generator. 
+    
+    Returns the :class:`numpy.random.Generator` that drives the draws and 
+    the seed to forward to helpers still expecting an integer seed 
+    (:func:`random_sampling`, :func:`add_noises_to`, `train_test_split`). 
+    Integer and ``None`` seeds are forwarded unchanged; any other seed is 
+    replaced by an integer drawn from the generator. The global NumPy 
+    random state is never touched.
+    
+    An integer seed is mixed with a stable hash of the dataset `name`, so 
+    that two generators called with the same seed do not replay the same 
+    stream on different features. 
+    """
+    if isinstance(seed, np.random.RandomState): 
+        seed = seed.randint(np.iinfo(np.int32).max)
+    if isinstance(seed, np.random.Generator): 
+        rng = seed 
+    elif name is not None and isinstance(seed, (int, np.integer)): 
+        rng = np.random.default_rng(
+            np.random.SeedSequence([int(seed), zlib.crc32(name.encode())]))
+    else:
+        rng = np.random.default_rng(seed)
+    if seed is not None and not isinstance(seed, (int, np.integer)):
+        seed = int(rng.integers(np.iinfo(np.int32).max))
+    return rng, seed
+
+def _random(rng, size, dtype=np.float32): 
+    """ Draw uniform samples over ``[0, 1)`` from `rng`. 
+    
+    Large draws are cut in fixed-size chunks, each filled by an independent 
+    generator spawned from a :class:`numpy.random.SeedSequence` seeded by 
+    `rng`. The chunks are filled on a thread pool (NumPy releases the GIL 
+    while filling), and since the chunking does not depend on the number 
+    of CPUs the result is the same for a given seed on any machine. 
+    """
+    values = np.empty(size, dtype=dtype)
+    flat = values.reshape(-1)
+    if flat.size < _PARALLEL_MIN_SIZE: 
+        rng.random(dtype=dtype, out=flat)
+        return values 
+    
+    chunks = [flat[i: i + _CHUNK_SIZE] 
+              for i in range(0, flat.size, _CHUNK_SIZE)]
+    seed_seq = np.random.SeedSequence(
+        rng.integers(0, 2**32, 4, dtype=np.uint64))
+    streams = [np.random.default_rng(s) for s in seed_seq.spawn(len(chunks))]
+    fill = lambda g, chunk: g.random(dtype=dtype, out=chunk)
+    n_workers = min(len(chunks), os.cpu_count() or 1)
+    if n_workers > 1: 
+        with ThreadPoolExecutor(n_workers) as executor: 
+            list(executor.map(fill, streams, chunks))
+    else: 
+        for g, chunk in zip(streams, chunks): 
+            fill(g, chunk)
+    return values 
+
+def _uniform(rng, low, high, size, dtype=np.float32): 
+    """ Draw uniform samples in the narrow `dtype` used by the generators. 
+    
+    None of the synthetic measures need double precision, so the draws are 
+    made in `dtype` directly rather than carried as float64 through pandas.
+    `low` and `high` may be arrays broadcasting against `size` to rescale 
+    several columns of a single draw at once. Rounding of the scaled draw 
+    in `dtype` can land on `high`, so values are clamped to the largest 
+    number below it to keep the half-open ``[low, high)`` interval.
+    """
+    values = _random(rng, size, dtype=dtype)
+    values *= high - low
+    values += low
+    high = np.asarray(high, dtype=dtype)
+    np.minimum(values, np.nextafter(high, np.asarray(low, dtype=dtype)), 
+               out=values)
+    return values
+
+def _choice_categorical(rng, categories, size): 
+    """ Draw `size` labels uniformly from `categories` as a Categorical. 
+    
+    Only the integer codes are drawn (the same stream ``rng.choice`` would 
+    consume); the labels are never materialized as an object array. 
+    """
+    return pd.Categorical.from_codes(
+        rng.integers(0, len(categories), size), categories)
+
+def _offset_dates(start, offsets, unit): 
+    """ Add integer `offsets` in `unit` (``'s'`` or ``'D'``) to `start`. 
+    
+    Naive timestamps take the numpy ``datetime64`` fast path. A tz-aware 
+    `start` goes through pandas so the dates keep their timezone, since 
+    ``Timestamp.to_datetime64`` converts to naive UTC. 
+    """
+    if start.tz is None: 
+        return start.to_datetime64() + offsets.astype(f'timedelta64[{unit}]')
+    return start + pd.to_timedelta(offsets, unit=unit)
+
+def _get_item_from ( spec , /,  default_items, default_number = 7, rng=None ): 
     """ Accept either interger or a list. 
     
     If integer is passed, number of items is randomly chosen. if 
@@ -3283,6 +3474,9 @@ def _get_item_from ( spec , /,  default_items, default_number = 7 ):
         Randomly select the number of specimens if `spec` is ``None``. 
         If ``None`` then take the length of all default items in 
         `default_items`. 
+    rng: np.random.Generator, optional 
+        Generator used to pick the items. A fresh unseeded generator is 
+        used if not given. 
     Return
     -------
     spec: list 
@@ -3296,8 +3490,13 @@ def _get_item_from ( spec , /,  default_items, default_number = 7 ):
         spec =default_number 
         
     if isinstance ( spec, ( int, float)): 
-        spec = np.random.choice (
-            default_items, default_number if int(spec)==0 else int (spec) )
+        if rng is None: 
+            rng = np.random.default_rng()
+        # Draw item indices and gather, rather than letting `choice` 
+        # convert the whole item list to a string array on every call.
+        codes = rng.integers(
+            0, len(default_items), default_number if int(spec)==0 else int (spec))
+        spec = [ default_items[k] for k in codes ]
     
     spec = is_iterable ( spec, exclude_string= True, transform =True )
     
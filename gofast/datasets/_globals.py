@@ -7,386 +7,742 @@ ensuring consistency and ease of maintenance. The leading underscore in its
 name implies that it's not intended for external use but rather serves as a 
 supportive component within the package.
 
+Mappings are exposed as read-only :class:`types.MappingProxyType` views so 
+that the shared tables cannot be altered in place by the dataset builders. 
+Callers that need a mutable copy should use ``dict(MAPPING)``. Item lists 
+are tuples and come with a ``<NAME>_SET`` frozenset for membership tests.
+
 """
-DYSPNEA_DICT = {
-    'start_date': 'The date when the observation or data collection period began.',
-    'starttime': 'The time when the observation or data collection period started.',
-    'endtime': 'The time when the observation or data collection period ended.',
-    'date_entered': 'The date when the data was entered into the dataset.',
-    'submission_time': 'The time when the data was submitted for inclusion in the dataset.',
-    'version': 'The version of the data collection form or dataset structure.',
-    'submitted_by': 'The individual or entity that submitted the data.',
-    'meta_instanceid': 'A unique identifier for the instance of data collection.',
-    'uuid': 'A universally unique identifier for the record.',
-    'id': 'A unique identifier for the patient or observation.',
-    'gender': 'The gender of the patient (e.g., male, female), as self-identified by the patient.',
-    'index': 'A sequential number or index assigned to the observation.',
-    'file_number': 'A unique file number assigned to the patient’s record.',
-    'age': 'The age of the patient at the time of observation.',
-    'not': 'Possibly a field for notes or remarks (requires clarification).',
-    'pad': 'Peripheral artery disease presence or assessment.',
-    'fc': 'Functional class; a measure of the severity of symptoms.',
-    'fr': 'Respiratory rate; the number of breaths per minute.',
-    'spo': 'Oxygen saturation; a measure of the amount of oxygen carried in the blood.',
-    'temperature': 'The patient’s body temperature.',
-    'glasgow_score': 'The Glasgow Coma Scale score, assessing the consciousness level.',
-    'diagnosis_pneumonitis': 'Indicator of whether pneumonitis was diagnosed.',
-    'diagnosis_asthma_attack': 'Indicator of whether an asthma attack was diagnosed.',
-    'diagnosis_pulmonary_tuberculosis': 'Indicator of whether pulmonary tuberculosis was diagnosed.',
-    'diagnosis_covid_19': 'Indicator of whether COVID-19 was diagnosed.',
-    'diagnosis_heart_failure': 'Indicator of whether heart failure was diagnosed.',
-    'diagnosis_copd': 'Indicator of whether chronic obstructive pulmonary disease (COPD) was diagnosed.',
-    'diagnosis_bronchial_cancer': 'Indicator of whether bronchial cancer was diagnosed.',
-    'diagnosis_pulmonary_fibrosis': 'Indicator of whether pulmonary fibrosis was diagnosed.',
-    'diagnostic_other': 'Field for other diagnoses not specifically listed.',
-    'parent_index': 'Link or reference to a parent record or observation, if applicable.',
-    'duration': 'The duration of the dyspnea episode or symptoms.',
-    'xform_id': 'A form or transformation identifier related to data processing.',
-    'dyspnea': 'The presence and severity of dyspnea or difficulty breathing.',
-    'nyha_intensity': 'The New York Heart Association classification for the intensity of heart failure symptoms.',
-    'frequency': 'The frequency of symptoms or episodes.',
-    'cough': 'The presence and characteristics of cough.',
-    'fever': 'The presence of fever.',
-    'asthenia': 'The presence of asthenia or abnormal physical weakness or lack of energy.',
-    'admission_method': 'The method or reason for admission to the healthcare facility.',
-    'establishment_of_origin': 'The originating establishment or location of the patient before admission.',
-    'toxic_tobacco': 'Tobacco use or exposure assessment.',
-    'toxic_alcohol': 'Alcohol use or exposure assessment.',
-    'condition': 'The general condition or status of the patient.',
-    'state_of_the_pupils': 'Assessment of the pupils’ condition or reactivity.',
-    'conjunctivas': 'Assessment of the conjunctivas, indicating potential anemia or jaundice.',
-    'imo': 'Possibly a specific medical observation or indicator (requires clarification).',
-    'condition_of_the_mucous_membranes': 'The condition or appearance of mucous membranes.',
-    'dehydration_skin_fold': 'Assessment of dehydration through skin fold test.',
-    'respiratory_distress': 'The presence and severity of respiratory distress.',
-    'heart_sound': 'Assessment of heart sounds, indicating potential cardiac issues.',
-    'breath': 'Characteristics of breathing or breath sounds.',
-    'heart_failure': 'Indicator or assessment of heart failure.',
-    'lymphadenopathy': 'The presence of enlarged lymph nodes.',
-    'diagnosis_retained': 'Final diagnosis or retained diagnosis after assessment.',
-    'outcome_of_hospitalization': 'The outcome following hospitalization (e.g., discharged, transferred, deceased).',
-}
-DYSPNEA_LABELS_DESCR={
-    'gender': {
-        0: 'Female',
-        1: 'Male'},
-     'dyspnea': {
-         0: 'Acute',
-         1: 'Chronic'},
-     'nyha_intensity': {
-         2: 'IV', 
-         1: 'III', 
-         0: 'II'},
-     'frequency': {
-         1: 'Polypnea',
-         0: 'Bradypnea'},
-     'cough': {
-         1: 'Yes', 
-         0: 'No'},
-     'fever': {
-         0: 'No',
-         1: 'Yes'},
-     'asthenia': {
-         0: 'No',
-         1: 'Yes'},
-     'admission_method': {
-         4: 'Taxi',
-         0: 'Ambulance',
-         2: 'Personal vehicle',
-         1: 'Firefighter',
-         3: 'SAMU'},
-     'establishment_of_origin': {
-         4: 'Clinical',
-        13: 'Residence',
-        11: 'ICA',
-        10: 'HMA',
-        7: 'HG',
-        1: 'CAT',
-        12: 'PMI',
-        9: 'HG Sikensi',
-        8: 'HG Adjamé',
-        3: 'Clinic and',
-        6: 'General Hospital',
-        0: 'Ambulance',
-        2: 'CHR',
-        14: 'University Hospital',
-        5: 'FSU',
-        15: 'Yopougon'},
-     'toxic_tobacco': {
-         0: 'No', 
-         1: 'Yes'},
-     'toxic_alcohol': {
-         0: 'No',
-         1: 'Yes'},
-     'condition': {
-         1: 'Bad', 
-         0: 'Average', 
-         2: 'Good'},
-     'state_of_the_pupils': {
-         0: 'Normal', 
-         1: 'Unnatural'},
-     'conjunctivas': {
-         1: 'Colorful', 
-         0: 'Blades',
-         2: 'Not very colorful'},
-     'imo': {
-         1: 'Yes',
-         0: 'No'},
-     'condition_of_the_mucous_membranes': {
-         0: 'Dry',
-         1: 'Wet'},
-     'dehydration_skin_fold': {
-         1: 'Yes', 
-         0: 'No'},
-     'respiratory_distress': {
-         1: 'Yes', 
-         0: 'No'},
-     'heart_sound': {
-         0: 'Normal', 
-         1: 'Unnatural'},
-     'breath': {
-         0: 'No',
-         1: 'Yes'},
-     'heart_failure': {
-         0: 'No', 
-         1: 'Yes'},
-     'lymphadenopathy': {
-         0: 'No', 
-         1: 'Yes'},
-     'diagnosis_retained': {
-          17: 'Pneumonitis',
-          13: 'Other',
-          16: 'Pneumonia Other',
-          3: 'Covid 19',
-          11: 'Heart failure',
-          2: 'COPD',
-          9: 'Covid 19 pneumonia',
-          23: 'Pulmonary tuberculosis Other',
-          19: 'Pulmonary tuberculosis',
-          0: 'Asthma attack',
-          18: 'Pneumonitis Pulmonary tuberculosis',
-          14: 'Pneumonia Asthma attack',
-          26: 'pulmonary fibrosis Other',
-          10: 'Covid 19 pneumonia Other',
-          7: 'Covid 19 Other',
-          12: 'Heart failure Other',
-          8: 'Covid 19 asthma attack',
-          1: 'Bronchial cancer',
-          6: 'Covid 19 Heart failure',
-          22: 'Pulmonary tuberculosis Covid 19 Other',
-          15: 'Pneumonia Heart failure',
-          24: 'Pulmonary tuberculosis pulmonary fibrosis Other',
-          25: 'pulmonary fibrosis',
-          21: 'Pulmonary tuberculosis Covid 19',
-          20: 'Pulmonary tuberculosis COPD',
-          5: 'Covid 19 COPD',
-          4: 'Covid 19 Bronchial cancer'},
-     'outcome_of_hospitalization': {
-          2: 'Return home',
-          0: 'Deceased',
-          3: 'Transfer to another care unit',
-          1: 'Discharge against medical advice'}
-     }
+from collections.abc import ItemsView, Mapping
+from types import MappingProxyType
 
-FORENSIC_BF_DICT={
-    'timestamp': 'Timestamp',
-    'gender': 'sex',
-    'age': 'Age',
-    'education_level': 'Level of study',
-    'occupation': 'Occupation',
-    'dna_knowledge': 'Do you think you know enough about using DNA to solve crimes?',
-    'dna_info_source': 'If YES, where did you get this information about using DNA to solve crimes?',
-    'support_national_dna_db_bf': 'As part of criminal investigations: Do you think that the creation of a national DNA database in Burkina Faso is:',
-    'dna_db_custodian_bf': 'Who should be responsible for the custody and management of a national DNA database in Burkina Faso?',
-    'dna_db_inclusion_criteria': 'Criteria for inclusion of a genetic profile in a DNA database. To be reserved for:',
-    'include_crime_scene_profiles': 'Should profiles from crime scenes be included directly in the national DNA database?',
-    'offense_type_dna_recording': 'What type of offense would merit the DNA profile of a convicted person being recorded in the database?',
-    'dna_storage_duration': 'For how long do you consider it necessary or normal for a DNA profile to be stored in a national database?',
-    'dna_use_family_research': 'As part of family research',
-    'dna_use_disaster_research': 'As part of research in the event of natural disasters and attacks',
-    'dna_use_interpol_cooperation': 'As part of Cooperation with INTERPOL',
-    'dna_use_terrorism_fight': 'As part of the fight against terrorism and organized crime',
-    'privacy_invasion_opinion': 'Do you think this is an invasion of privacy?',
-    'voluntary_dna_donation': 'Would you agree to voluntarily donate your own DNA to enrich a possible genetic database? (NB: This could help, for example, to find your loved ones or to identify you in the event of your disappearance...)',
-    'privacy_risk_concern': 'What is your level of concern about the risk of invasion of privacy?',
-    'database_misuse_concern': 'Are you concerned about misuse of this database?',
-    'dna_use_in_investigations': 'Do you think they use DNA profiles in criminal investigations?',
-    'police_lab_support_need': 'Do you think that the police and national gendarmerie services must be equipped with scientific and especially genetic laboratories to support criminal investigations?',
-    'forensic_dna_private_sector': 'Do you instead think that forensic DNA testing should be carried out by the private sector?',
-    'forensic_dna_autonomous_institution': 'Or do you rather think that forensic DNA testing should be carried out by an autonomous state institution other than the Police and Gendarmerie?',
-    'message_to_investigators': 'What would you like to say to the initiators of this investigation?'
-}
+import numpy as np 
 
-FORENSIC_LABELS_DESCR={
- 'gender': {
-                  1: 'Male', 
-                  0: 'Female'},
- 'age': {
-                  1: '35-60', 
-                  0: '16-35', 
-                  2: '>60'},
- 'education_level': {
-                  0: 'PhD',
-                  2: 'University',
-                  1: 'Secondary'},
- 'occupation': {
-                  5: 'Ministry responsible for security',
-                  7: 'Students',
-                  6: 'Others',
-                  1: 'Ministry of Higher Education and Scientific Research, Others',
-                  0: 'Ministry of Higher Education and Scientific Research',
-                  3: 'Ministry of Justice',
-                  2: 'Ministry of Higher Education and Scientific Research, Students',
-                  8: 'Students, Others',
-                  4: 'Ministry of Justice, Others'},
- 'dna_knowledge': {
-                  3: 'Yes', 
-                  0: 'I am not sure', 
-                  1: "I don't know", 
-                  2: 'No'},
- 'dna_info_source': {0: 'During my studies (secondary and/or higher)',
-                  4: 'Reading (newspapers and scientific documents)',
-                  5: 'The media (TV news, radio, documentaries)',
-                  3: 'Others',
-                  1: 'Fiction films',
-                  2: 'NaN'},
- 'support_national_dna_db_bf': {
-                  0: 'Important',
-                  3: 'Unitile',
-                  2: 'Not very important',
-                  1: 'Ineffective'},
- 'dna_db_custodian_bf': {
-                  1: 'Ministry of Justice',
-                  4: 'The national police and gendarmerie services',
-                  3: 'Others',
-                  2: 'Ministry responsible for security',
-                  0: 'An autonomous institution'},
- 'dna_db_inclusion_criteria': {
-                  0: 'Condemned',
-                  3: 'Entire population of Burkina Faso',
-                  2: 'Convicts, suspects and volunteers',
-                  1: 'Convicts and suspects',
-                  4: 'Nobody'},
- 'include_crime_scene_profiles': {
-                  1: 'No',
-                  2: 'Yes',
-                  0: "I don't know",
-                  3: 'am indifferent'},
- 'offense_type_dna_recording': {
-                  0: 'All crimes',
-                  1: 'All crimes and offenses',
-                  2: 'Gender-based violence',
-                  4: 'Serious crimes only',
-                  3: 'No answer'},
- 'dna_storage_duration': { 
-                  0: 'Indefinitely',
-                  2: 'Until acquittal',
-                  3: 'Until the death of the condemned',
-                  1: 'No answer'},
- 'dna_use_family_research': {
-                  1: 'No I do not agree',
-                  3: 'Yes, I agree but in certain circumstances',
-                  2: 'Yes I agree',
-                  0: "I don't know"},
- 'dna_use_disaster_research': { 
-                  3: 'Yes, I agree but in certain circumstances',
-                  2: 'Yes I agree',
-                  0: "I don't know",
-                  1: 'No I do not agree'},
- 'dna_use_interpol_cooperation': {
-                  2: 'Yes I agree',
-                  3: 'yes I agree but in certain circumstances',
-                  0: "I don't know",
-                  1: 'No I do not agree'},
- 'dna_use_terrorism_fight': {
-                  2: 'Yes I agree',
-                  3: 'yes I agree but in certain circumstances',
-                  0: "I don't know",
-                  1: 'No I do not agree'},
- 'privacy_invasion_opinion': {
-                  1: 'No',
-                  0: 'Maybe', 
-                  2: 'Yes'},
- 'voluntary_dna_donation': {
-                  3: 'Yes, but under certain conditions',
-                  2: 'Yes',
-                  1: 'No',
-                  0: 'Maybe'},
- 'privacy_risk_concern': {
-                  4: 'No problem',
-                  2: 'Important concerns',
-                  3: 'Minor concerns',
-                  0: "I don't know",
-                  5: 'am indifferent',
-                  1: 'I have no response'},
- 'database_misuse_concern': {
-                  3: 'Minor concerns',
-                  1: 'Important concerns',
-                  5: 'No problem',
-                  2: 'Indifferent',
-                  4: 'No answer',
-                  0: "I don't know"},
- 'dna_use_in_investigations': {
-                  2: 'No',
-                  1: 'Maybe',
-                  0: "I don't know",
-                  3: 'Yes'},
- 'police_lab_support_need': {
-                  2: 'Yes', 
-                  1: 'No', 
-                  0: 'Maybe'},
- 'forensic_dna_private_sector': {
-                  1: 'Maybe',
-                  3: 'Yes',
-                  2: 'No',
-                  0: "I don't know"},
- 'forensic_dna_autonomous_institution': {
-                  3: 'Yes',
-                  2: 'No',
-                  1: 'Maybe',
-                  0: "I don't know"}
- }  
+class CategoricalMap(Mapping):
+    """Read-only ``{code: label}`` mapping of an encoded categorical feature.
+    
+    The labels are dictionary-encoded: they are held once in a dense object 
+    array indexed by their integer code, so ``cmap[code]`` is a plain array 
+    access instead of a dict lookup. Codes missing from the source mapping 
+    are left as holes and raise :class:`KeyError` like a dict would.
+    
+    Parameters 
+    -----------
+    mapping: dict 
+        The ``{code: label}`` table where codes are non-negative integers.
+        
+    Examples
+    --------
+    >>> from gofast.datasets._globals import CategoricalMap 
+    >>> cmap = CategoricalMap({1: 'Male', 0: 'Female'})
+    >>> cmap[1]
+    'Male'
+    >>> cmap.to_dict()
+    {0: 'Female', 1: 'Male'}
+    >>> cmap.inverse['Female']
+    0
+    """
+    __slots__ = ("labels", "inverse")
+    
+    def __init__(self, mapping):
+        labels = np.empty(max(mapping) + 1, dtype=object)
+        labels[list(mapping)] = list(mapping.values())
+        # the map may be shared by several features, so freeze its labels
+        labels.flags.writeable = False 
+        self.labels = labels 
+        # read-only ``{label: code}`` table for reverse lookups
+        self.inverse = MappingProxyType(
+            {label: code for code, label in mapping.items()})
+        
+    def __getitem__(self, code):
+        # Look codes up like dict keys: integral floats such as ``1.0`` 
+        # (codes read back from a CSV with NaN) match ``1``, while booleans 
+        # and any other key raise KeyError.
+        try: 
+            if isinstance(code, (bool, np.bool_)) or int(code) != code: 
+                raise KeyError(code)
+            index = int(code)
+            label = self.labels[index] if 0 <= index < len(self.labels) else None 
+        except (IndexError, TypeError, ValueError, OverflowError): 
+            label = None 
+        if label is None: 
+            raise KeyError(code)
+        return label 
+    
+    def __iter__(self):
+        return (code for code, label in enumerate(self.labels)
+                if label is not None)
+    
+    def __len__(self):
+        return sum(label is not None for label in self.labels)
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
     
+    def __reduce__(self):
+        return self.__class__, (self.to_dict(),)
+    
+    def to_dict(self):
+        """Return the mapping as a plain ``{code: label}`` dict."""
+        return dict(self.items())
+    
+    def decode(self, codes):
+        """Decode an array of codes into labels with one vectorized gather.
+        
+        Parameters 
+        -----------
+        codes: array-like of int 
+            Codes of the feature, e.g. an encoded DataFrame column.
+            
+        Returns 
+        --------
+        labels: ndarray of object 
+            The label of each code. Codes without a label decode to ``None``.
+        """
+        codes = np.asarray(codes)
+        if codes.size and codes.min() < 0: 
+            raise IndexError("Codes must be non-negative integers.")
+        return self.labels[codes]
+    
+    @property 
+    def dtype(self):
+        """Narrowest unsigned integer dtype that holds every code."""
+        return np.min_scalar_type(len(self.labels) - 1)
+    
+    def pack(self, codes):
+        """Bit-pack the codes of a binary feature, eight codes per byte.
+        
+        Parameters 
+        -----------
+        codes: array-like 
+            Codes of the feature, each ``0`` or ``1``.
+            
+        Returns 
+        --------
+        packed: ndarray of uint8 
+            The packed codes. Use :meth:`unpack` with the number of codes 
+            to restore them.
+        """
+        if len(self.labels) > 2: 
+            raise ValueError(
+                f"Only binary features can be bit-packed; got "
+                f"{len(self.labels)} codes.")
+        return np.packbits(np.asarray(codes, dtype=np.uint8))
+    
+    def unpack(self, packed, n):
+        """Restore the first `n` codes packed with :meth:`pack`."""
+        return np.unpackbits(np.asarray(packed, dtype=np.uint8), count=n)
 
-WATER_QUAN_NEEDS= {
-    "Agri Demand": "Agricultural Water Demand",
-    "Indus Demand": "Industrial Water Demand",
-    "Domestic Demand": "Domestic Water Demand",
-    "Municipal Demand": "Municipal Water Demand",
-    "Livestock Needs": "Livestock Water Needs",
-    "Irrigation Req": "Irrigation Water Requirements",
-    "Hydropower Gen": "Hydropower Generation",
-    "Aquaculture Usage": "Aquaculture Water Usage",
-    "Mining Consumption": "Mining Water Consumption",
-    "Thermal Plant Consumption": "Thermal Power Plant Water Consumption",
-    "Ecosystems": "Water for Ecosystems",
-    "Forestry": "Water for Forestry",
-    "Recreation": "Water for Recreation",
-    "Urban Dev": "Water for Urban Development",
-    "Drinking": "Water for Drinking",
-    "Sanitation": "Water for Sanitation",
-    "Food Processing": "Water for Food Processing",
-    "Textile Industry": "Water for Textile Industry",
-    "Paper Industry": "Water for Paper Industry",
-    "Chemical Industry": "Water for Chemical Industry",
-    "Pharma Industry": "Water for Pharmaceutical Industry",
-    "Construction": "Water for Construction",
-    "Energy Production": "Water for Energy Production",
-    "Oil Refining": "Water for Oil Refining",
-    "Metals Production": "Water for Metals Production",
-    "Auto Manufacturing": "Water for Automobile Manufacturing",
-    "Electronics Manufacturing": "Water for Electronics Manufacturing",
-    "Plastics Manufacturing": "Water for Plastics Manufacturing",
-    "Leather Industry": "Water for Leather Industry",
-    "Beverage Industry": "Water for Beverage Industry",
-    "Pulp & Paper Industry": "Water for Pulp and Paper Industry",
-    "Sugar Industry": "Water for Sugar Industry",
-    "Cement Industry": "Water for Cement Industry",
-    "Fertilizer Industry": "Water for Fertilizer Industry",
-}
+# Identical ``{code: label}`` tables share one CategoricalMap instance.
+YES_NO = CategoricalMap({0: 'No', 1: 'Yes'})
+MAYBE_NO_YES = CategoricalMap({0: 'Maybe', 1: 'No', 2: 'Yes'})
+_SHARED_MAPS = {tuple(cmap.items()): cmap for cmap in (YES_NO, MAYBE_NO_YES)}
+
+def _shared_map(labels):
+    """Return the shared CategoricalMap equal to the `labels` table."""
+    key = tuple(sorted(labels.items()))
+    cmap = _SHARED_MAPS.get(key)
+    if cmap is None: 
+        cmap = _SHARED_MAPS[key] = CategoricalMap(labels)
+    return cmap 
+
+class _PrefixIndexedMap(Mapping):
+    """Read-only mapping of synthetic ``'<prefix><k>'`` keys to labels.
+    
+    Keys such as ``'Type1' ... 'Type33'`` only carry a 1-based position, so 
+    the labels are stored in a dense object array and ``'Type<k>'`` resolves 
+    to ``labels[k - 1]`` without hashing the key. The array can be indexed 
+    directly with integer codes to gather many labels at once.
+    """
+    __slots__ = ("prefix", "labels")
+    
+    def __init__(self, prefix, labels):
+        self.prefix = prefix 
+        self.labels = np.array(labels, dtype=object)
+        self.labels.flags.writeable = False 
+        
+    def __getitem__(self, key):
+        suffix = (key[len(self.prefix):] if isinstance(key, str) 
+                  and key.startswith(self.prefix) else '')
+        if not (suffix.isdigit() and suffix[0] != '0' 
+                and int(suffix) <= len(self.labels)): 
+            raise KeyError(key)
+        return self.labels[int(suffix) - 1]
+    
+    def __iter__(self):
+        return (f"{self.prefix}{k}" for k in range(1, len(self.labels) + 1))
+    
+    def __len__(self):
+        return len(self.labels)
+
+class RegionTable(Mapping):
+    """Read-only ``{language: regions}`` table stored dictionary-encoded.
+    
+    Every distinct region name is held once in `regions`. The table itself 
+    is a pair of parallel ``int8`` code arrays, `lang_codes` and 
+    `region_codes`, so the regions where a language is spoken are gathered 
+    with one vectorized scan by :meth:`regions_for`. Single lookups such 
+    as ``table[language]`` are served from a precomputed tuple per 
+    language. Regions keep their original order within a language.
+    
+    Parameters 
+    -----------
+    mapping: dict 
+        The ``{language: [region, ...]}`` table to encode.
+    """
+    __slots__ = ("languages", "regions", "lang_codes", "region_codes", 
+                 "_by_language")
+    
+    def __init__(self, mapping):
+        self.languages = tuple(mapping)
+        self.regions = np.array(sorted(
+            {region for regions in mapping.values() for region in regions}), 
+            dtype=object)
+        index = {region: code for code, region in enumerate(self.regions)}
+        pairs = [(lang_code, index[region]) 
+                 for lang_code, regions in enumerate(mapping.values()) 
+                 for region in regions]
+        self.lang_codes = np.array([lc for lc, _ in pairs], dtype=np.int8)
+        self.region_codes = np.array([rc for _, rc in pairs], dtype=np.int8)
+        for array in (self.regions, self.lang_codes, self.region_codes): 
+            array.flags.writeable = False 
+        self._by_language = {
+            language: tuple(regions) for language, regions in mapping.items()}
+        
+    def regions_for(self, language):
+        """Return the regions of `language` as an object array."""
+        try: 
+            lang_code = self.languages.index(language)
+        except ValueError: 
+            raise KeyError(language) from None 
+        return self.regions[self.region_codes[self.lang_codes == lang_code]]
+    
+    def __getitem__(self, language):
+        return self._by_language[language]
+    
+    def __iter__(self):
+        return iter(self.languages)
+    
+    def __len__(self):
+        return len(self.languages)
+
+class _ParallelMap(Mapping):
+    """Read-only mapping over two parallel tuples of keys and values.
+    
+    Iteration walks the tuples side by side and a lookup resolves the key 
+    position once, then reads the value tuple at that position.
+    """
+    __slots__ = ("_keys", "_values", "_index")
+    
+    def __init__(self, keys, values):
+        self._keys = tuple(keys)
+        self._values = tuple(values)
+        self._index = {key: pos for pos, key in enumerate(self._keys)}
+        
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def __len__(self):
+        return len(self._keys)
+    
+    def items(self):
+        return _ParallelItemsView(self)
+
+class _ParallelItemsView(ItemsView):
+    """Items view of :class:`_ParallelMap` that zips the tuples directly."""
+    
+    def __iter__(self):
+        return zip(self._mapping._keys, self._mapping._values)
+
+class LabelsBundle(Mapping):
+    """Read-only bundle of the :class:`CategoricalMap` of each feature.
+    
+    Features are reachable both as keys and as attributes, i.e. 
+    ``bundle['gender']`` or ``bundle.gender`` as with 
+    :class:`~gofast.tools.box.Boxspace`. Bundles are created with 
+    :meth:`from_descr`, which declares the feature names as ``__slots__`` 
+    so no per-instance ``__dict__`` is allocated. Bundles are immutable, so 
+    copies return the bundle itself and pickling rebuilds it from the plain 
+    ``{feature: {code: label}}`` tables.
+    """
+    __slots__ = ()
+    
+    @classmethod 
+    def from_descr(cls, name, descr):
+        """Encode the ``{feature: {code: label}}`` tables of `descr`.
+        
+        Parameters 
+        -----------
+        name: str 
+            Name of the bundle class created for the features of `descr`.
+        descr: dict 
+            The ``{code: label}`` table of each encoded feature.
+        """
+        bundle = type(name, (cls,), {
+            "__slots__": tuple(descr), 
+            "__module__": __name__, 
+            "__qualname__": f"{cls.__qualname__}.{name}",
+            })()
+        for feature, labels in descr.items(): 
+            object.__setattr__(bundle, feature, _shared_map(labels))
+        return bundle 
+    
+    def __getitem__(self, feature):
+        if feature not in self.__slots__: 
+            raise KeyError(feature)
+        return getattr(self, feature)
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self):
+        return len(self.__slots__)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__!r} object is read-only")
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(self)})"
+    
+    def __reduce__(self):
+        return LabelsBundle.from_descr, (
+            type(self).__name__, 
+            {feature: cmap.to_dict() for feature, cmap in self.items()})
+    
+    def __copy__(self):
+        return self 
+    
+    def __deepcopy__(self, memo):
+        return self 
+
+def _build_dyspnea_dict():
+    """Build the columns description of the dyspnea dataset."""
+    return MappingProxyType({
+        'start_date': 'The date when the observation or data collection period began.',
+        'starttime': 'The time when the observation or data collection period started.',
+        'endtime': 'The time when the observation or data collection period ended.',
+        'date_entered': 'The date when the data was entered into the dataset.',
+        'submission_time': 'The time when the data was submitted for inclusion in the dataset.',
+        'version': 'The version of the data collection form or dataset structure.',
+        'submitted_by': 'The individual or entity that submitted the data.',
+        'meta_instanceid': 'A unique identifier for the instance of data collection.',
+        'uuid': 'A universally unique identifier for the record.',
+        'id': 'A unique identifier for the patient or observation.',
+        'gender': 'The gender of the patient (e.g., male, female), as self-identified by the patient.',
+        'index': 'A sequential number or index assigned to the observation.',
+        'file_number': 'A unique file number assigned to the patient’s record.',
+        'age': 'The age of the patient at the time of observation.',
+        'not': 'Possibly a field for notes or remarks (requires clarification).',
+        'pad': 'Peripheral artery disease presence or assessment.',
+        'fc': 'Functional class; a measure of the severity of symptoms.',
+        'fr': 'Respiratory rate; the number of breaths per minute.',
+        'spo': 'Oxygen saturation; a measure of the amount of oxygen carried in the blood.',
+        'temperature': 'The patient’s body temperature.',
+        'glasgow_score': 'The Glasgow Coma Scale score, assessing the consciousness level.',
+        'diagnosis_pneumonitis': 'Indicator of whether pneumonitis was diagnosed.',
+        'diagnosis_asthma_attack': 'Indicator of whether an asthma attack was diagnosed.',
+        'diagnosis_pulmonary_tuberculosis': 'Indicator of whether pulmonary tuberculosis was diagnosed.',
+        'diagnosis_covid_19': 'Indicator of whether COVID-19 was diagnosed.',
+        'diagnosis_heart_failure': 'Indicator of whether heart failure was diagnosed.',
+        'diagnosis_copd': 'Indicator of whether chronic obstructive pulmonary disease (COPD) was diagnosed.',
+        'diagnosis_bronchial_cancer': 'Indicator of whether bronchial cancer was diagnosed.',
+        'diagnosis_pulmonary_fibrosis': 'Indicator of whether pulmonary fibrosis was diagnosed.',
+        'diagnostic_other': 'Field for other diagnoses not specifically listed.',
+        'parent_index': 'Link or reference to a parent record or observation, if applicable.',
+        'duration': 'The duration of the dyspnea episode or symptoms.',
+        'xform_id': 'A form or transformation identifier related to data processing.',
+        'dyspnea': 'The presence and severity of dyspnea or difficulty breathing.',
+        'nyha_intensity': 'The New York Heart Association classification for the intensity of heart failure symptoms.',
+        'frequency': 'The frequency of symptoms or episodes.',
+        'cough': 'The presence and characteristics of cough.',
+        'fever': 'The presence of fever.',
+        'asthenia': 'The presence of asthenia or abnormal physical weakness or lack of energy.',
+        'admission_method': 'The method or reason for admission to the healthcare facility.',
+        'establishment_of_origin': 'The originating establishment or location of the patient before admission.',
+        'toxic_tobacco': 'Tobacco use or exposure assessment.',
+        'toxic_alcohol': 'Alcohol use or exposure assessment.',
+        'condition': 'The general condition or status of the patient.',
+        'state_of_the_pupils': 'Assessment of the pupils’ condition or reactivity.',
+        'conjunctivas': 'Assessment of the conjunctivas, indicating potential anemia or jaundice.',
+        'imo': 'Possibly a specific medical observation or indicator (requires clarification).',
+        'condition_of_the_mucous_membranes': 'The condition or appearance of mucous membranes.',
+        'dehydration_skin_fold': 'Assessment of dehydration through skin fold test.',
+        'respiratory_distress': 'The presence and severity of respiratory distress.',
+        'heart_sound': 'Assessment of heart sounds, indicating potential cardiac issues.',
+        'breath': 'Characteristics of breathing or breath sounds.',
+        'heart_failure': 'Indicator or assessment of heart failure.',
+        'lymphadenopathy': 'The presence of enlarged lymph nodes.',
+        'diagnosis_retained': 'Final diagnosis or retained diagnosis after assessment.',
+        'outcome_of_hospitalization': 'The outcome following hospitalization (e.g., discharged, transferred, deceased).',
+    })
+def _build_dyspnea_labels_descr():
+    """Build the encoded labels of the dyspnea dataset."""
+    return LabelsBundle.from_descr('DyspneaLabels', {
+        'gender': {
+            0: 'Female',
+            1: 'Male'},
+         'dyspnea': {
+             0: 'Acute',
+             1: 'Chronic'},
+         'nyha_intensity': {
+             2: 'IV', 
+             1: 'III', 
+             0: 'II'},
+         'frequency': {
+             1: 'Polypnea',
+             0: 'Bradypnea'},
+         'cough': {
+             1: 'Yes', 
+             0: 'No'},
+         'fever': {
+             0: 'No',
+             1: 'Yes'},
+         'asthenia': {
+             0: 'No',
+             1: 'Yes'},
+         'admission_method': {
+             4: 'Taxi',
+             0: 'Ambulance',
+             2: 'Personal vehicle',
+             1: 'Firefighter',
+             3: 'SAMU'},
+         'establishment_of_origin': {
+             4: 'Clinical',
+            13: 'Residence',
+            11: 'ICA',
+            10: 'HMA',
+            7: 'HG',
+            1: 'CAT',
+            12: 'PMI',
+            9: 'HG Sikensi',
+            8: 'HG Adjamé',
+            3: 'Clinic and',
+            6: 'General Hospital',
+            0: 'Ambulance',
+            2: 'CHR',
+            14: 'University Hospital',
+            5: 'FSU',
+            15: 'Yopougon'},
+         'toxic_tobacco': {
+             0: 'No', 
+             1: 'Yes'},
+         'toxic_alcohol': {
+             0: 'No',
+             1: 'Yes'},
+         'condition': {
+             1: 'Bad', 
+             0: 'Average', 
+             2: 'Good'},
+         'state_of_the_pupils': {
+             0: 'Normal', 
+             1: 'Unnatural'},
+         'conjunctivas': {
+             1: 'Colorful', 
+             0: 'Blades',
+             2: 'Not very colorful'},
+         'imo': {
+             1: 'Yes',
+             0: 'No'},
+         'condition_of_the_mucous_membranes': {
+             0: 'Dry',
+             1: 'Wet'},
+         'dehydration_skin_fold': {
+             1: 'Yes', 
+             0: 'No'},
+         'respiratory_distress': {
+             1: 'Yes', 
+             0: 'No'},
+         'heart_sound': {
+             0: 'Normal', 
+             1: 'Unnatural'},
+         'breath': {
+             0: 'No',
+             1: 'Yes'},
+         'heart_failure': {
+             0: 'No', 
+             1: 'Yes'},
+         'lymphadenopathy': {
+             0: 'No', 
+             1: 'Yes'},
+         'diagnosis_retained': {
+              17: 'Pneumonitis',
+              13: 'Other',
+              16: 'Pneumonia Other',
+              3: 'Covid 19',
+              11: 'Heart failure',
+              2: 'COPD',
+              9: 'Covid 19 pneumonia',
+              23: 'Pulmonary tuberculosis Other',
+              19: 'Pulmonary tuberculosis',
+              0: 'Asthma attack',
+              18: 'Pneumonitis Pulmonary tuberculosis',
+              14: 'Pneumonia Asthma attack',
+              26: 'pulmonary fibrosis Other',
+              10: 'Covid 19 pneumonia Other',
+              7: 'Covid 19 Other',
+              12: 'Heart failure Other',
+              8: 'Covid 19 asthma attack',
+              1: 'Bronchial cancer',
+              6: 'Covid 19 Heart failure',
+              22: 'Pulmonary tuberculosis Covid 19 Other',
+              15: 'Pneumonia Heart failure',
+              24: 'Pulmonary tuberculosis pulmonary fibrosis Other',
+              25: 'pulmonary fibrosis',
+              21: 'Pulmonary tuberculosis Covid 19',
+              20: 'Pulmonary tuberculosis COPD',
+              5: 'Covid 19 COPD',
+              4: 'Covid 19 Bronchial cancer'},
+         'outcome_of_hospitalization': {
+              2: 'Return home',
+              0: 'Deceased',
+              3: 'Transfer to another care unit',
+              1: 'Discharge against medical advice'}
+         })
+
+def _build_forensic_bf_dict():
+    """Build the columns description of the forensic dataset."""
+    return MappingProxyType({
+        'timestamp': 'Timestamp',
+        'gender': 'sex',
+        'age': 'Age',
+        'education_level': 'Level of study',
+        'occupation': 'Occupation',
+        'dna_knowledge': 'Do you think you know enough about using DNA to solve crimes?',
+        'dna_info_source': 'If YES, where did you get this information about using DNA to solve crimes?',
+        'support_national_dna_db_bf': 'As part of criminal investigations: Do you think that the creation of a national DNA database in Burkina Faso is:',
+        'dna_db_custodian_bf': 'Who should be responsible for the custody and management of a national DNA database in Burkina Faso?',
+        'dna_db_inclusion_criteria': 'Criteria for inclusion of a genetic profile in a DNA database. To be reserved for:',
+        'include_crime_scene_profiles': 'Should profiles from crime scenes be included directly in the national DNA database?',
+        'offense_type_dna_recording': 'What type of offense would merit the DNA profile of a convicted person being recorded in the database?',
+        'dna_storage_duration': 'For how long do you consider it necessary or normal for a DNA profile to be stored in a national database?',
+        'dna_use_family_research': 'As part of family research',
+        'dna_use_disaster_research': 'As part of research in the event of natural disasters and attacks',
+        'dna_use_interpol_cooperation': 'As part of Cooperation with INTERPOL',
+        'dna_use_terrorism_fight': 'As part of the fight against terrorism and organized crime',
+        'privacy_invasion_opinion': 'Do you think this is an invasion of privacy?',
+        'voluntary_dna_donation': 'Would you agree to voluntarily donate your own DNA to enrich a possible genetic database? (NB: This could help, for example, to find your loved ones or to identify you in the event of your disappearance...)',
+        'privacy_risk_concern': 'What is your level of concern about the risk of invasion of privacy?',
+        'database_misuse_concern': 'Are you concerned about misuse of this database?',
+        'dna_use_in_investigations': 'Do you think they use DNA profiles in criminal investigations?',
+        'police_lab_support_need': 'Do you think that the police and national gendarmerie services must be equipped with scientific and especially genetic laboratories to support criminal investigations?',
+        'forensic_dna_private_sector': 'Do you instead think that forensic DNA testing should be carried out by the private sector?',
+        'forensic_dna_autonomous_institution': 'Or do you rather think that forensic DNA testing should be carried out by an autonomous state institution other than the Police and Gendarmerie?',
+        'message_to_investigators': 'What would you like to say to the initiators of this investigation?'
+    })
+
+def _build_forensic_labels_descr():
+    """Build the encoded labels of the forensic dataset."""
+    return LabelsBundle.from_descr('ForensicLabels', {
+     'gender': {
+                      1: 'Male', 
+                      0: 'Female'},
+     'age': {
+                      1: '35-60', 
+                      0: '16-35', 
+                      2: '>60'},
+     'education_level': {
+                      0: 'PhD',
+                      2: 'University',
+                      1: 'Secondary'},
+     'occupation': {
+                      5: 'Ministry responsible for security',
+                      7: 'Students',
+                      6: 'Others',
+                      1: 'Ministry of Higher Education and Scientific Research, Others',
+                      0: 'Ministry of Higher Education and Scientific Research',
+                      3: 'Ministry of Justice',
+                      2: 'Ministry of Higher Education and Scientific Research, Students',
+                      8: 'Students, Others',
+                      4: 'Ministry of Justice, Others'},
+     'dna_knowledge': {
+                      3: 'Yes', 
+                      0: 'I am not sure', 
+                      1: "I don't know", 
+                      2: 'No'},
+     'dna_info_source': {0: 'During my studies (secondary and/or higher)',
+                      4: 'Reading (newspapers and scientific documents)',
+                      5: 'The media (TV news, radio, documentaries)',
+                      3: 'Others',
+                      1: 'Fiction films',
+                      2: 'NaN'},
+     'support_national_dna_db_bf': {
+                      0: 'Important',
+                      3: 'Unitile',
+                      2: 'Not very important',
+                      1: 'Ineffective'},
+     'dna_db_custodian_bf': {
+                      1: 'Ministry of Justice',
+                      4: 'The national police and gendarmerie services',
+                      3: 'Others',
+                      2: 'Ministry responsible for security',
+                      0: 'An autonomous institution'},
+     'dna_db_inclusion_criteria': {
+                      0: 'Condemned',
+                      3: 'Entire population of Burkina Faso',
+                      2: 'Convicts, suspects and volunteers',
+                      1: 'Convicts and suspects',
+                      4: 'Nobody'},
+     'include_crime_scene_profiles': {
+                      1: 'No',
+                      2: 'Yes',
+                      0: "I don't know",
+                      3: 'am indifferent'},
+     'offense_type_dna_recording': {
+                      0: 'All crimes',
+                      1: 'All crimes and offenses',
+                      2: 'Gender-based violence',
+                      4: 'Serious crimes only',
+                      3: 'No answer'},
+     'dna_storage_duration': { 
+                      0: 'Indefinitely',
+                      2: 'Until acquittal',
+                      3: 'Until the death of the condemned',
+                      1: 'No answer'},
+     'dna_use_family_research': {
+                      1: 'No I do not agree',
+                      3: 'Yes, I agree but in certain circumstances',
+                      2: 'Yes I agree',
+                      0: "I don't know"},
+     'dna_use_disaster_research': { 
+                      3: 'Yes, I agree but in certain circumstances',
+                      2: 'Yes I agree',
+                      0: "I don't know",
+                      1: 'No I do not agree'},
+     'dna_use_interpol_cooperation': {
+                      2: 'Yes I agree',
+                      3: 'yes I agree but in certain circumstances',
+                      0: "I don't know",
+                      1: 'No I do not agree'},
+     'dna_use_terrorism_fight': {
+                      2: 'Yes I agree',
+                      3: 'yes I agree but in certain circumstances',
+                      0: "I don't know",
+                      1: 'No I do not agree'},
+     'privacy_invasion_opinion': {
+                      1: 'No',
+                      0: 'Maybe', 
+                      2: 'Yes'},
+     'voluntary_dna_donation': {
+                      3: 'Yes, but under certain conditions',
+                      2: 'Yes',
+                      1: 'No',
+                      0: 'Maybe'},
+     'privacy_risk_concern': {
+                      4: 'No problem',
+                      2: 'Important concerns',
+                      3: 'Minor concerns',
+                      0: "I don't know",
+                      5: 'am indifferent',
+                      1: 'I have no response'},
+     'database_misuse_concern': {
+                      3: 'Minor concerns',
+                      1: 'Important concerns',
+                      5: 'No problem',
+                      2: 'Indifferent',
+                      4: 'No answer',
+                      0: "I don't know"},
+     'dna_use_in_investigations': {
+                      2: 'No',
+                      1: 'Maybe',
+                      0: "I don't know",
+                      3: 'Yes'},
+     'police_lab_support_need': {
+                      2: 'Yes', 
+                      1: 'No', 
+                      0: 'Maybe'},
+     'forensic_dna_private_sector': {
+                      1: 'Maybe',
+                      3: 'Yes',
+                      2: 'No',
+                      0: "I don't know"},
+     'forensic_dna_autonomous_institution': {
+                      3: 'Yes',
+                      2: 'No',
+                      1: 'Maybe',
+                      0: "I don't know"}
+     })
+    
+
+# Shorthand and longhand names of the water-need features, by position.
+WATER_QUAN_SHORT = (
+    "Agri Demand",
+    "Indus Demand",
+    "Domestic Demand",
+    "Municipal Demand",
+    "Livestock Needs",
+    "Irrigation Req",
+    "Hydropower Gen",
+    "Aquaculture Usage",
+    "Mining Consumption",
+    "Thermal Plant Consumption",
+    "Ecosystems",
+    "Forestry",
+    "Recreation",
+    "Urban Dev",
+    "Drinking",
+    "Sanitation",
+    "Food Processing",
+    "Textile Industry",
+    "Paper Industry",
+    "Chemical Industry",
+    "Pharma Industry",
+    "Construction",
+    "Energy Production",
+    "Oil Refining",
+    "Metals Production",
+    "Auto Manufacturing",
+    "Electronics Manufacturing",
+    "Plastics Manufacturing",
+    "Leather Industry",
+    "Beverage Industry",
+    "Pulp & Paper Industry",
+    "Sugar Industry",
+    "Cement Industry",
+    "Fertilizer Industry",
+)
+WATER_QUAN_LONG = (
+    "Agricultural Water Demand",
+    "Industrial Water Demand",
+    "Domestic Water Demand",
+    "Municipal Water Demand",
+    "Livestock Water Needs",
+    "Irrigation Water Requirements",
+    "Hydropower Generation",
+    "Aquaculture Water Usage",
+    "Mining Water Consumption",
+    "Thermal Power Plant Water Consumption",
+    "Water for Ecosystems",
+    "Water for Forestry",
+    "Water for Recreation",
+    "Water for Urban Development",
+    "Water for Drinking",
+    "Water for Sanitation",
+    "Water for Food Processing",
+    "Water for Textile Industry",
+    "Water for Paper Industry",
+    "Water for Chemical Industry",
+    "Water for Pharmaceutical Industry",
+    "Water for Construction",
+    "Water for Energy Production",
+    "Water for Oil Refining",
+    "Water for Metals Production",
+    "Water for Automobile Manufacturing",
+    "Water for Electronics Manufacturing",
+    "Water for Plastics Manufacturing",
+    "Water for Leather Industry",
+    "Water for Beverage Industry",
+    "Water for Pulp and Paper Industry",
+    "Water for Sugar Industry",
+    "Water for Cement Industry",
+    "Water for Fertilizer Industry",
+)
+WATER_QUAN_NEEDS = _ParallelMap(WATER_QUAN_SHORT, WATER_QUAN_LONG)
 
 # Define categorical feature values
-WATER_QUAL_NEEDS= {
+WATER_QUAL_NEEDS = MappingProxyType({
     "Water Quality": ["Excellent",
                       "Good", 
                       "Fair", 
@@ -419,7 +775,7 @@ WATER_QUAL_NEEDS= {
         "Bron",
         "Asante"
         ],
-    "Region": {
+    "Region": RegionTable({
         "English": [
             "United States", 
             "United Kingdom",
@@ -509,94 +865,94 @@ WATER_QUAL_NEEDS= {
         "Baoule": ["Cote d'Ivoire"],
         "Bron": ["Cote d'Ivoire","Ghana"],
         "Asante": ["Ghana", "Cote d'Ivoire"],
-        },
+        }),
         # Random GDP per capita values
         # np.random.uniform(1000, 50000, num_samples).round(2),
     "Economic Status": [], # will define later    
-}
+})
 
 # SDG6 Challenges dictionary with shorthand keys
-SDG6_CHALLENGES = {
+SDG6_CHALLENGES = MappingProxyType({
     "Lack of Access": "Access",
     "Water Scarcity": "Scarcity",
     "Water Pollution": "Pollution",
     "Ecosystem Degradation": "Ecosystems",
     "Governance Issues": "Governance",
-}
+})
 
-ORE_TYPE = {
-    'Type1': 'Gold Ore',
-    'Type2': 'Iron Ore',
-    'Type3': 'Copper Ore',
-    'Type4': 'Silver Ore',
-    'Type5': 'Lead Ore',
-    'Type6': 'Zinc Ore',
-    'Type7': 'Nickel Ore',
-    'Type8': 'Tin Ore',
-    'Type9': 'Bauxite',
-    'Type10': 'Cobalt Ore',
-    'Type11': 'Chromite',
-    'Type12': 'Uranium Ore',
-    'Type13': 'Manganese Ore',
-    'Type14': 'Platinum Ore',
-    'Type15': 'Tantalum Ore',
-    'Type16': 'Vanadium Ore',
-    'Type17': 'Molybdenum Ore',
-    'Type18': 'Titanium Ore',
-    'Type19': 'Lithium Ore',
-    'Type20': 'Tungsten Ore',
-    'Type21': 'Antimony Ore',
-    'Type22': 'Mercury Ore',
-    'Type23': 'Sulfur Ore',
-    'Type24': 'Graphite Ore',
-    'Type25': 'Diamond Ore',
-    'Type26': 'Rare Earth Element Ores',
-    'Type27': 'Phosphate Ore',
-    'Type28': 'Gypsum Ore',
-    'Type29': 'Fluorite Ore',
-    'Type30': 'Barite Ore',
-    'Type31': 'Asbestos Ore',
-    'Type32': 'Boron Ore',
-    'Type33': 'Potash Ore'
-}
+ORE_TYPE = _PrefixIndexedMap('Type', [
+    'Gold Ore',
+    'Iron Ore',
+    'Copper Ore',
+    'Silver Ore',
+    'Lead Ore',
+    'Zinc Ore',
+    'Nickel Ore',
+    'Tin Ore',
+    'Bauxite',
+    'Cobalt Ore',
+    'Chromite',
+    'Uranium Ore',
+    'Manganese Ore',
+    'Platinum Ore',
+    'Tantalum Ore',
+    'Vanadium Ore',
+    'Molybdenum Ore',
+    'Titanium Ore',
+    'Lithium Ore',
+    'Tungsten Ore',
+    'Antimony Ore',
+    'Mercury Ore',
+    'Sulfur Ore',
+    'Graphite Ore',
+    'Diamond Ore',
+    'Rare Earth Element Ores',
+    'Phosphate Ore',
+    'Gypsum Ore',
+    'Fluorite Ore',
+    'Barite Ore',
+    'Asbestos Ore',
+    'Boron Ore',
+    'Potash Ore'
+])
 
-EXPLOSIVE_TYPE = {
-    'Explosive1': 'ANFO (Ammonium Nitrate Fuel Oil)',
-    'Explosive2': 'Water Gel Explosives',
-    'Explosive3': 'Emulsion Explosives',
-    'Explosive4': 'Dynamite',
-    'Explosive5': 'Nitroglycerin',
-    'Explosive6': 'Slurry Explosives',
-    'Explosive7': 'Binary Explosives',
-    'Explosive8': 'Boosters',
-    'Explosive9': 'Detonating Cord',
-    'Explosive10': 'C-4 (Plastic Explosive)',
-    'Explosive11': 'Ammonium Nitrate',
-    'Explosive12': 'Black Powder',
-    'Explosive13': 'TNT (Trinitrotoluene)',
-    'Explosive14': 'RDX (Cyclotrimethylenetrinitramine)',
-    'Explosive15': 'PETN (Pentaerythritol Tetranitrate)',
-    'Explosive16': 'ANFO Prills',
-    'Explosive17': 'Cast Boosters',
-    'Explosive18': 'Ammonium Nitrate Emulsion',
-    'Explosive19': 'Nitrocellulose',
-    'Explosive20': 'Aluminized Explosives',
-    'Explosive21': 'Pentolite',
-    'Explosive22': 'Semtex',
-    'Explosive23': 'Nitroguanidine',
-    'Explosive24': 'HMX (Cyclotetramethylenetetranitramine)',
-    'Explosive25': 'Amatol',
-    'Explosive26': 'Tetryl',
-    'Explosive27': 'Composition B',
-    'Explosive28': 'Water Gels with Sensitizers',
-    'Explosive29': 'Nitrate Mixture Explosives',
-    'Explosive30': 'Perchlorate Explosives',
-    'Explosive31': 'Detonators (Non-Electric)',
-    'Explosive32': 'Electric Detonators',
-    'Explosive33': 'Electronic Detonators'
-}
+EXPLOSIVE_TYPE = _PrefixIndexedMap('Explosive', [
+    'ANFO (Ammonium Nitrate Fuel Oil)',
+    'Water Gel Explosives',
+    'Emulsion Explosives',
+    'Dynamite',
+    'Nitroglycerin',
+    'Slurry Explosives',
+    'Binary Explosives',
+    'Boosters',
+    'Detonating Cord',
+    'C-4 (Plastic Explosive)',
+    'Ammonium Nitrate',
+    'Black Powder',
+    'TNT (Trinitrotoluene)',
+    'RDX (Cyclotrimethylenetrinitramine)',
+    'PETN (Pentaerythritol Tetranitrate)',
+    'ANFO Prills',
+    'Cast Boosters',
+    'Ammonium Nitrate Emulsion',
+    'Nitrocellulose',
+    'Aluminized Explosives',
+    'Pentolite',
+    'Semtex',
+    'Nitroguanidine',
+    'HMX (Cyclotetramethylenetetranitramine)',
+    'Amatol',
+    'Tetryl',
+    'Composition B',
+    'Water Gels with Sensitizers',
+    'Nitrate Mixture Explosives',
+    'Perchlorate Explosives',
+    'Detonators (Non-Electric)',
+    'Electric Detonators',
+    'Electronic Detonators'
+])
 
-EQUIPMENT_TYPE = [
+EQUIPMENT_TYPE = (
     'Excavator', 
     'Drill', 
     'Loader', 
@@ -659,10 +1015,35 @@ EQUIPMENT_TYPE = [
     "Impact Crushers",
     "Hammer Mills",
     "Sizers"
-]
+)
+EQUIPMENT_TYPE_SET = frozenset(EQUIPMENT_TYPE)
+# Generic singular names that duplicate an entry of EQUIPMENT_TYPE. Specific 
+# machines such as "Haul Trucks" or "Rotary Drills" are kept distinct.
+_EQUIPMENT_ALIASES = {
+    'Excavator': 'Excavators', 
+    'Drill': 'Drilling Rigs', 
+    'Loader': 'Loaders', 
+    'Truck': 'Dump Trucks',
+}
+EQUIPMENT_TYPE_CANON = tuple(sorted(
+    {_EQUIPMENT_ALIASES.get(name, name) for name in EQUIPMENT_TYPE}))
+# Code of the canonical equipment for every name of EQUIPMENT_TYPE. 
+EQUIPMENT_CODE = MappingProxyType({
+    name: EQUIPMENT_TYPE_CANON.index(_EQUIPMENT_ALIASES.get(name, name)) 
+    for name in EQUIPMENT_TYPE})
+
+# Geophysical survey instruments of the ERT and TEM generators. 
+ERT_EQUIPMENT = ('SuperSting R8', 'Ministing or Sting R1', 'OhmMapper')
+ERT_EQUIPMENT_SET = frozenset(ERT_EQUIPMENT)
+TEM_EQUIPMENT = (
+    'Stratagem EH5-Geometric', 
+    'IRIS Remote Field Probes',
+    'Phoenix Atlas RTM System', 
+    'Zonge GDP 24-bit Receiver'
+)
 
 
-COMMON_CROPS = [
+COMMON_CROPS = (
     "Wheat", 
     "Rice",
     "Corn",
@@ -716,12 +1097,13 @@ COMMON_CROPS = [
     "Pineapples",
     "Mangoes",
     "Avocados"
-]
+)
+COMMON_CROPS_SET = frozenset(COMMON_CROPS)
 
-COMMON_PESTICIDES = [
+COMMON_PESTICIDES = (
     'Herbicide',
     'Insecticide',
-    'Fungicide'
+    'Fungicide',
     "Glyphosate", 
     "Atrazine",
     "2,4-Dichlorophenoxyacetic acid (2,4-D)", 
@@ -778,8 +1160,9 @@ COMMON_PESTICIDES = [
     "Methyl Bromide",
     "Chloropicrin",
     "Vapam"
-]
-AFRICAN_COUNTRIES= [
+)
+COMMON_PESTICIDES_SET = frozenset(COMMON_PESTICIDES)
+AFRICAN_COUNTRIES = (
     "Algeria",
     "Angola",
     "Benin", 
@@ -834,8 +1217,9 @@ AFRICAN_COUNTRIES= [
     "Uganda",
     "Zambia",
     "Zimbabwe"
-]
-DIAGNOSIS_UNITS = {
+)
+AFRICAN_COUNTRIES_SET = frozenset(AFRICAN_COUNTRIES)
+DIAGNOSIS_UNITS = MappingProxyType({
     'age': 'years',
     'gender': 'category',
     'ethnicity': 'category',
@@ -877,86 +1261,92 @@ DIAGNOSIS_UNITS = {
     'flu_vaccine': 'binary',
     'covid_19_vaccine': 'binary',
     'other_vaccines': 'binary'
-}
+})
 
 #  all hydrogeological parameters with their definitions
 # DATAFRAME WITH has id and name and location in the world. 
-HYDRO_PARAMS = {
-    "porosity": (
-        "Measure of the void spaces in a material, indicating how much water"
-        " a rock formation can store."
-        ),
-    "permeability": "Indicates how easily water can flow through the rock formations.",
-    "hydraulic_conductivity": (
-        "Measures the ability of the formation to transmit water under a"
-        " hydraulic gradient."),
-    "transmissivity":(
-        "Measure of how much water can be transmitted horizontally through an aquifer."
-        ),
-    "storativity_or_specific_yield": (
-        "Reflects the volume of water that an aquifer can store and yield."),
-    "fracture_density_and_orientation":(
-        "Density and orientation of fractures, crucial for predicting water"
-        " flow patterns.")
-    ,
-    "water_table_depth": "Direct measurement of the depth to the water table.",
-    "aquifer_pressure": (
-        "Pressure within aquifers, affected by geological stresses, affecting"
-        " water storage and movement."
-        ),
-    "water_quality_parameters": ( 
-        "Includes salinity, pH, and presence of contaminants, determining "
-        "groundwater suitability for uses."
-        ),
-    "temperature_gradients": (
-        "Indicates geothermal gradients, affecting water quality and "
-        "geothermal energy potential."
-        )
-}
+def _build_hydro_params():
+    """Build the hydrogeological parameters with their definitions."""
+    return MappingProxyType({
+        "porosity": (
+            "Measure of the void spaces in a material, indicating how much water"
+            " a rock formation can store."
+            ),
+        "permeability": "Indicates how easily water can flow through the rock formations.",
+        "hydraulic_conductivity": (
+            "Measures the ability of the formation to transmit water under a"
+            " hydraulic gradient."),
+        "transmissivity":(
+            "Measure of how much water can be transmitted horizontally through an aquifer."
+            ),
+        "storativity_or_specific_yield": (
+            "Reflects the volume of water that an aquifer can store and yield."),
+        "fracture_density_and_orientation":(
+            "Density and orientation of fractures, crucial for predicting water"
+            " flow patterns.")
+        ,
+        "water_table_depth": "Direct measurement of the depth to the water table.",
+        "aquifer_pressure": (
+            "Pressure within aquifers, affected by geological stresses, affecting"
+            " water storage and movement."
+            ),
+        "water_quality_parameters": ( 
+            "Includes salinity, pH, and presence of contaminants, determining "
+            "groundwater suitability for uses."
+            ),
+        "temperature_gradients": (
+            "Indicates geothermal gradients, affecting water quality and "
+            "geothermal energy potential."
+            )
+    })
 
 # hydrogeological parameters crucial for deep mining with their roles
-RELEVANT_HYDRO_PARAMS = {
-    "permeability": (
-        "Indicates risk of water ingress by showing how easily water can"
-        " flow through rock formations, indicating risk of water ingress."
-        ),
-    "hydraulic_conductivity": (
-        "Measures the rock's ability to transmit water under a hydraulic "
-        "gradient, crucial for understanding water movement and "
-        "indicating risk of water ingress."
-        ),
-    "fracture_density_and_orientation": (
-        "Crucial for planning mine layouts to avoid water or gas ingress"
-        " hazards."
-        ),
-    "water_table_depth": ( 
-        "Helps predict potential for water inflow and the need for dewatering"
-        " operations.") ,
-    "storativity_or_specific_yield": ( 
-        "Important for managing water control measures and dewatering"
-        " strategies.") ,
-    "aquifer_pressure": ( 
-        "Affects the risk of water inflow from high-pressure aquifers, "
-        "requiring careful management."),
-    "temperature_gradients": ( 
-        "Affects working conditions and mine stability, important for "
-        "ventilation and cooling system design.") ,
-    "water_quality_parameters":(
-        "Important for environmental impact management and ensuring "
-        "safety of discharged water.")
-}
+def _build_relevant_hydro_params():
+    """Build the hydrogeological parameters crucial for deep mining."""
+    return MappingProxyType({
+        "permeability": (
+            "Indicates risk of water ingress by showing how easily water can"
+            " flow through rock formations, indicating risk of water ingress."
+            ),
+        "hydraulic_conductivity": (
+            "Measures the rock's ability to transmit water under a hydraulic "
+            "gradient, crucial for understanding water movement and "
+            "indicating risk of water ingress."
+            ),
+        "fracture_density_and_orientation": (
+            "Crucial for planning mine layouts to avoid water or gas ingress"
+            " hazards."
+            ),
+        "water_table_depth": ( 
+            "Helps predict potential for water inflow and the need for dewatering"
+            " operations.") ,
+        "storativity_or_specific_yield": ( 
+            "Important for managing water control measures and dewatering"
+            " strategies.") ,
+        "aquifer_pressure": ( 
+            "Affects the risk of water inflow from high-pressure aquifers, "
+            "requiring careful management."),
+        "temperature_gradients": ( 
+            "Affects working conditions and mine stability, important for "
+            "ventilation and cooling system design.") ,
+        "water_quality_parameters":(
+            "Important for environmental impact management and ensuring "
+            "safety of discharged water.")
+    })
 
-HYDRO_PARAM_UNITS={
-    "porosity": "% (percentage)",
-    "permeability": "Darcy (D) or millidarcy (mD)",
-    "hydraulic_conductivity": "m/D (meters per darcies)",
-    "transmissivity": "m2/day (square meters per day)",
-    "storativity": "dimensionless (volume of water per volume of aquifer)",
-    "specific_yield": "% (percentage)",
-    "water_table_depth": "m (meters)",
-    "aquifer_pressure": "Pa (Pascal) or bar",
-    "temperature": "°C (degrees Celsius)"
-}
+def _build_hydro_param_units():
+    """Build the units of the hydrogeological parameters."""
+    return MappingProxyType({
+        "porosity": "% (percentage)",
+        "permeability": "Darcy (D) or millidarcy (mD)",
+        "hydraulic_conductivity": "m/D (meters per darcies)",
+        "transmissivity": "m2/day (square meters per day)",
+        "storativity": "dimensionless (volume of water per volume of aquifer)",
+        "specific_yield": "% (percentage)",
+        "water_table_depth": "m (meters)",
+        "aquifer_pressure": "Pa (Pascal) or bar",
+        "temperature": "°C (degrees Celsius)"
+    })
 
 # Note: The list and details are illustrative and based on generalized data; 
 # specific figures andBased on the insights gathered from various sources,
@@ -967,346 +1357,367 @@ HYDRO_PARAM_UNITS={
 # to highlight a diverse range of countries and their contributions to the 
 # global mining sector, focusing on various minerals and their economic impact.
 
-MINERAL_PROD_BY_COUNTRY = {
-    "Australia": [
-        "Vast reserves of bauxite, iron ore, lithium",
-        "High production capacity for iron ore, lithium", 
-        "Major exporter of lithium, iron ore"
-        ],
-    "China": [
-        "Large reserves of coal, rare earth elements",
-        "World's top producer of several minerals including rare earths, gold",
-        "Significant exporter of rare earth elements, gold"
-        ],
-    "Russia": [
-        "Significant reserves of palladium, nickel",
-        "Leading producer of palladium, nickel",
-        "Major exporter of palladium, nickel"
-        ],
-    "United States": [
-        "Large reserves of coal, copper", 
-        "Top producer of gypsum, and significant production of copper, gold",
-        "Major exporter of gypsum, significant exporter of copper, gold"
-        ],
-    "Canada": [
-        "Substantial reserves of potash, uranium",
-        "Leading producer of potash, uranium", 
-         "Key exporter of potash, uranium"
-         ],
-    "Brazil": [
-        "Rich in iron ore, niobium", 
-        "Top producer of iron ore, niobium",
-        "Leading exporter of iron ore, niobium"
-        ],
-    "South Africa": [
-        "Huge reserves of platinum, chromium",
-        "World's top producer of platinum, chromium",
-        "Major exporter of platinum, chromium"
-        ],
-    "India": [
-        "Significant reserves of coal, iron ore",
-        "Major producer of coal, iron ore",
-        "Substantial exporter of iron ore"
-        ],
-    "Indonesia": [
-        "Large coal reserves, significant gold, nickel", 
-        "Top coal exporter, major producer of gold, nickel",
-        "World's top coal exporter, significant exporter of gold, nickel"
-        ],
-    "Chile": [
-        "World's largest copper reserves", 
-        "Top producer and exporter of copper", 
-        "Leading exporter of copper"
-        ],
-    "Peru": [
-        "Significant silver, copper, gold reserves", 
-        "Major producer of silver, copper", 
-        "Important exporter of silver, copper"
-        ],
-    "Kazakhstan": [
-        "Large reserves of uranium, chromium",
-        "Top producer of uranium, significant producer of chromium", 
-        "Leading exporter of uranium"
-        ],
-    "Argentina": [
-        "Rich in lithium, silver, copper", 
-        "Growing producer of lithium",
-        "Emerging exporter of lithium and silver"
-        ],
-    "Philippines": [
-        "Significant nickel, gold reserves",
-        "Major producer of nickel",
-        "Top exporter of nickel"
-        ],
-    "Ghana": [
-        "Major gold producing country", 
-        "Significant gold production capacity", 
-        "Important gold exporter"
-        ],
-    "Mexico": [
-        "World's largest silver reserves",
-        "Top producer of silver", 
-        "Leading exporter of silver"
-        ],
-    "Sweden": [
-        "Significant iron ore, copper reserves",
-        "Major producer of iron ore", 
-        "Key exporter of iron ore, copper"
-        ],
-    "Zambia": [
-        "Large copper reserves", 
-        "Second-largest copper producer in Africa",
-        "Significant copper exporter"
-        ],
-    "Democratic Republic of Congo": [
-        "World's largest cobalt reserves",
-        "Top producer of cobalt", 
-        "Major exporter of cobalt"
-        ],
-    "Zimbabwe": [
-        "Significant platinum, diamonds",
-        "Major producer of platinum",
-        "Important exporter of platinum"
-        ],
-    "Mongolia": [
-        "Rich in coal, copper, gold",
-        "Significant coal and copper production", 
-        "Important exporter of coal"
-        ],
-    "Saudi Arabia": [
-        "Large reserves of phosphate, gold", 
-        "Major producer of phosphate", 
-        "Key exporter of phosphate"
-        ],
-    "United Arab Emirates": [
-        "Significant aluminum producer", 
-        "Major aluminum production capacity", 
-        "Leading exporter of aluminum"
-        ],
-    "Turkey": [
-        "Substantial marble, boron reserves",
-        "Top producer of boron", 
-        "Major exporter of marble, boron"
-        ],
-    "Norway": [
-        "Significant producer of petroleum, metals",
-        "Major oil exporter, significant metals production", 
-        "Key exporter of metals, oil"
-        ],
-    "Vietnam": [
-        "Rich in bauxite, rare earth elements",
-        "Growing bauxite producer",
-        "Emerging exporter of bauxite"
-        ],
-    "Nigeria": [
-        "Significant oil, gas reserves; emerging in minerals",
-        "Major oil producer, growing in minerals like gold",
-        "Top oil exporter, emerging mineral exporter"
-        ],
-    "Tanzania": [
-        "Rich in gold, diamonds, gemstones",
-        "Major gold producer",
-        "Important gold, gemstone exporter"
-        ],
-    "Papua New Guinea": [
-        "Significant gold, copper reserves",
-        "Major gold, copper producer", 
-        "Key exporter of gold, copper"
-        ],
-    "Iran": [
-        "Large reserves of copper, iron ore, zinc", 
-        "Significant producer of copper, iron ore", 
-        "Important exporter of minerals"
-        ],
-    "Ukraine": [
-        "Rich in iron ore, coal", 
-        "Significant production of iron ore, coal",
-        "Important exporter of iron ore"
-        ],
-    "Poland": [
-        "Substantial coal reserves",
-        "Major coal producer",
-        "Key coal exporter"
-        ],
-    "Bolivia": [
-        "Large deposits of silver, lithium",
-        "Major producer of silver, growing lithium production",
-        "Significant exporter of silver"
-        ],
-    "Namibia": [
-        "Significant uranium, diamonds",
-        "Major uranium producer",
-        "Important exporter of uranium, diamonds"
-        ],
-    "Botswana": [
-        "World-leading diamond reserves",
-        "Top diamond producer", 
-        "Major diamond exporter"
-        ],
-    "New Zealand": [
-        "Considerable coal, gold reserves",
-        "Significant coal and gold production", 
-        "Exporter of coal and gold"
-        ],
-    "Finland": [
-        "Rich in nickel, chromium",
-        "Significant producer of nickel", 
-        "Key exporter of nickel, chromium"
-        ],
-    "Mali": [
-        "Significant gold reserves",
-        "Major gold producer",
-        "Important gold exporter"
-        ],
-    "Burkina Faso": [
-        "Growing gold production", 
-        "Significant gold producer", 
-        "Emerging gold exporter"
-        ],
-    "Colombia": [
-        "Large coal, emerald reserves",
-        "Major coal producer and top emerald producer", 
-        "Key exporter of coal and emeralds"
-        ],
-    "Qatar": [
-        "Rich in petroleum, natural gas", 
-        "Major petroleum and natural gas producer",
-        "Top exporter of liquefied natural gas"
-        ],
-    "Egypt": [
-        "Substantial gold, phosphate", 
-        "Growing gold producer, major phosphate producer",
-        "Important exporter of phosphate"
-        ],
-    "Oman": [
-        "Significant gypsum, copper",
-        "Major gypsum producer",
-        "Leading exporter of gypsum"
-        ],
-    "Angola": [
-        "Rich in diamonds, oil", 
-        "Major diamond producer, significant oil production",
-        "Key exporter of diamonds and oil"
-        ],
-    "Kuwait": [
-        "Large petroleum reserves", 
-        "Significant petroleum production", 
-        "Major petroleum exporter"
-        ],
-    "Libya": [
-        "Substantial oil reserves",
-        "Major oil producer",
-        "Significant oil exporter"
-        ],
-    "Bahrain": [
-        "Significant oil, natural gas", 
-        "Major oil and natural gas production",
-        "Key exporter of petroleum products"
-        ],
-    "Bangladesh": [
-        "Considerable natural gas", 
-        "Significant natural gas production", 
-        "Emerging exporter of natural gas"
-        ],
-    "Cuba": [
-        "Rich in nickel, cobalt",
-        "Major nickel producer", 
-        "Important exporter of nickel and cobalt"
-        ],
-    "Venezuela": [
-        "Large petroleum reserves",
-        "Major oil producer", 
-        "Key oil exporter"
-        ],
-    "Suriname": [
-        "Significant bauxite reserves",
-        "Notable bauxite production",
-        "Bauxite exporter"
-        ],
-    "Guinea": [
-        "World-leading bauxite reserves",
-        "Top bauxite producer", 
-        "Major bauxite exporter"
-        ],
-    "Senegal": [
-        "Significant phosphate reserves",
-        "Phosphate production", 
-        "Phosphate exporter"
-        ],
-    "Cameroon": [
-        "Emerging iron ore, bauxite production",
-        "Developing mining sector",
-        "Potential exporter of iron ore and bauxite"
-        ],
-    "Sierra Leone": [
-        "Rich in diamonds", 
-        "Significant diamond producer",
-        "Diamond exporter"
-        ],
-    "Ivory Coast": [
-        "Growing gold, manganese production",
-        "Emerging in gold and manganese", 
-        "Potential gold and manganese exporter"
-        ],
-    "Liberia": [
-        "Iron ore reserves",
-        "Iron ore production",
-        "Iron ore exporter"
-        ],
-    "Mozambique": [
-        "Significant coal, titanium reserves",
-        "Coal and titanium production", 
-        "Coal and titanium exporter"
-        ],
-    "Madagascar": [
-        "Large graphite, nickel reserves",
-        "Graphite and nickel production", 
-        "Graphite and nickel exporter"
-        ],
-    "Lesotho": [
-        "Significant diamond reserves",
-        "Diamond production",
-        "Diamond exporter"
-        ],
-    "Ethiopia": [
-        "Emerging in opal, gold, and tantalum",
-        "Opal, gold, and tantalum production",
-        "Opal, gold, and tantalum exporter"
-        ],
-    "Kyrgyzstan": [
-        "Gold, coal, and antimony reserves", 
-        "Gold, coal, and antimony production",
-        "Gold, coal, and antimony exporter"
-        ],
-    "Tajikistan": [
-        "Significant silver and gold reserves",
-        "Silver and gold production",
-        "Silver and gold exporter"
-        ],
-    "Myanmar": [
-        "Rich in jade, gems, and tin",
-        "Jade, gems, and tin production", 
-        "Jade, gems, and tin exporter"
-        ],
-    "Laos": [
-        "Emerging potash and gold production",
-        "Developing mining sector for potash and gold", 
-        "Potential potash and gold exporter"
-        ],
-    "Brunei": [
-        "Petroleum and natural gas reserves",
-        "Petroleum and natural gas production",
-        "Petroleum and natural gas exporter"
-        ],
-    "Turkmenistan": [
-        "Significant natural gas reserves",
-        "Natural gas production", 
-        "Natural gas exporter"
-        ],
-    "Uzbekistan": [
-        "Gold, uranium, and copper reserves", 
-        "Gold, uranium, and copper production",
-        "Gold, uranium, and copper exporter"
-        ]
-}
+def _build_mineral_prod_by_country():
+    """Build the mineral production profile of each country.
+    
+    Each country maps to an immutable ``(reserves, production, exports)`` 
+    tuple of descriptions.
+    """
+    return MappingProxyType({
+        "Australia": (
+            "Vast reserves of bauxite, iron ore, lithium",
+            "High production capacity for iron ore, lithium", 
+            "Major exporter of lithium, iron ore"
+            ),
+        "China": (
+            "Large reserves of coal, rare earth elements",
+            "World's top producer of several minerals including rare earths, gold",
+            "Significant exporter of rare earth elements, gold"
+            ),
+        "Russia": (
+            "Significant reserves of palladium, nickel",
+            "Leading producer of palladium, nickel",
+            "Major exporter of palladium, nickel"
+            ),
+        "United States": (
+            "Large reserves of coal, copper", 
+            "Top producer of gypsum, and significant production of copper, gold",
+            "Major exporter of gypsum, significant exporter of copper, gold"
+            ),
+        "Canada": (
+            "Substantial reserves of potash, uranium",
+            "Leading producer of potash, uranium", 
+             "Key exporter of potash, uranium"
+             ),
+        "Brazil": (
+            "Rich in iron ore, niobium", 
+            "Top producer of iron ore, niobium",
+            "Leading exporter of iron ore, niobium"
+            ),
+        "South Africa": (
+            "Huge reserves of platinum, chromium",
+            "World's top producer of platinum, chromium",
+            "Major exporter of platinum, chromium"
+            ),
+        "India": (
+            "Significant reserves of coal, iron ore",
+            "Major producer of coal, iron ore",
+            "Substantial exporter of iron ore"
+            ),
+        "Indonesia": (
+            "Large coal reserves, significant gold, nickel", 
+            "Top coal exporter, major producer of gold, nickel",
+            "World's top coal exporter, significant exporter of gold, nickel"
+            ),
+        "Chile": (
+            "World's largest copper reserves", 
+            "Top producer and exporter of copper", 
+            "Leading exporter of copper"
+            ),
+        "Peru": (
+            "Significant silver, copper, gold reserves", 
+            "Major producer of silver, copper", 
+            "Important exporter of silver, copper"
+            ),
+        "Kazakhstan": (
+            "Large reserves of uranium, chromium",
+            "Top producer of uranium, significant producer of chromium", 
+            "Leading exporter of uranium"
+            ),
+        "Argentina": (
+            "Rich in lithium, silver, copper", 
+            "Growing producer of lithium",
+            "Emerging exporter of lithium and silver"
+            ),
+        "Philippines": (
+            "Significant nickel, gold reserves",
+            "Major producer of nickel",
+            "Top exporter of nickel"
+            ),
+        "Ghana": (
+            "Major gold producing country", 
+            "Significant gold production capacity", 
+            "Important gold exporter"
+            ),
+        "Mexico": (
+            "World's largest silver reserves",
+            "Top producer of silver", 
+            "Leading exporter of silver"
+            ),
+        "Sweden": (
+            "Significant iron ore, copper reserves",
+            "Major producer of iron ore", 
+            "Key exporter of iron ore, copper"
+            ),
+        "Zambia": (
+            "Large copper reserves", 
+            "Second-largest copper producer in Africa",
+            "Significant copper exporter"
+            ),
+        "Democratic Republic of Congo": (
+            "World's largest cobalt reserves",
+            "Top producer of cobalt", 
+            "Major exporter of cobalt"
+            ),
+        "Zimbabwe": (
+            "Significant platinum, diamonds",
+            "Major producer of platinum",
+            "Important exporter of platinum"
+            ),
+        "Mongolia": (
+            "Rich in coal, copper, gold",
+            "Significant coal and copper production", 
+            "Important exporter of coal"
+            ),
+        "Saudi Arabia": (
+            "Large reserves of phosphate, gold", 
+            "Major producer of phosphate", 
+            "Key exporter of phosphate"
+            ),
+        "United Arab Emirates": (
+            "Significant aluminum producer", 
+            "Major aluminum production capacity", 
+            "Leading exporter of aluminum"
+            ),
+        "Turkey": (
+            "Substantial marble, boron reserves",
+            "Top producer of boron", 
+            "Major exporter of marble, boron"
+            ),
+        "Norway": (
+            "Significant producer of petroleum, metals",
+            "Major oil exporter, significant metals production", 
+            "Key exporter of metals, oil"
+            ),
+        "Vietnam": (
+            "Rich in bauxite, rare earth elements",
+            "Growing bauxite producer",
+            "Emerging exporter of bauxite"
+            ),
+        "Nigeria": (
+            "Significant oil, gas reserves; emerging in minerals",
+            "Major oil producer, growing in minerals like gold",
+            "Top oil exporter, emerging mineral exporter"
+            ),
+        "Tanzania": (
+            "Rich in gold, diamonds, gemstones",
+            "Major gold producer",
+            "Important gold, gemstone exporter"
+            ),
+        "Papua New Guinea": (
+            "Significant gold, copper reserves",
+            "Major gold, copper producer", 
+            "Key exporter of gold, copper"
+            ),
+        "Iran": (
+            "Large reserves of copper, iron ore, zinc", 
+            "Significant producer of copper, iron ore", 
+            "Important exporter of minerals"
+            ),
+        "Ukraine": (
+            "Rich in iron ore, coal", 
+            "Significant production of iron ore, coal",
+            "Important exporter of iron ore"
+            ),
+        "Poland": (
+            "Substantial coal reserves",
+            "Major coal producer",
+            "Key coal exporter"
+            ),
+        "Bolivia": (
+            "Large deposits of silver, lithium",
+            "Major producer of silver, growing lithium production",
+            "Significant exporter of silver"
+            ),
+        "Namibia": (
+            "Significant uranium, diamonds",
+            "Major uranium producer",
+            "Important exporter of uranium, diamonds"
+            ),
+        "Botswana": (
+            "World-leading diamond reserves",
+            "Top diamond producer", 
+            "Major diamond exporter"
+            ),
+        "New Zealand": (
+            "Considerable coal, gold reserves",
+            "Significant coal and gold production", 
+            "Exporter of coal and gold"
+            ),
+        "Finland": (
+            "Rich in nickel, chromium",
+            "Significant producer of nickel", 
+            "Key exporter of nickel, chromium"
+            ),
+        "Mali": (
+            "Significant gold reserves",
+            "Major gold producer",
+            "Important gold exporter"
+            ),
+        "Burkina Faso": (
+            "Growing gold production", 
+            "Significant gold producer", 
+            "Emerging gold exporter"
+            ),
+        "Colombia": (
+            "Large coal, emerald reserves",
+            "Major coal producer and top emerald producer", 
+            "Key exporter of coal and emeralds"
+            ),
+        "Qatar": (
+            "Rich in petroleum, natural gas", 
+            "Major petroleum and natural gas producer",
+            "Top exporter of liquefied natural gas"
+            ),
+        "Egypt": (
+            "Substantial gold, phosphate", 
+            "Growing gold producer, major phosphate producer",
+            "Important exporter of phosphate"
+            ),
+        "Oman": (
+            "Significant gypsum, copper",
+            "Major gypsum producer",
+            "Leading exporter of gypsum"
+            ),
+        "Angola": (
+            "Rich in diamonds, oil", 
+            "Major diamond producer, significant oil production",
+            "Key exporter of diamonds and oil"
+            ),
+        "Kuwait": (
+            "Large petroleum reserves", 
+            "Significant petroleum production", 
+            "Major petroleum exporter"
+            ),
+        "Libya": (
+            "Substantial oil reserves",
+            "Major oil producer",
+            "Significant oil exporter"
+            ),
+        "Bahrain": (
+            "Significant oil, natural gas", 
+            "Major oil and natural gas production",
+            "Key exporter of petroleum products"
+            ),
+        "Bangladesh": (
+            "Considerable natural gas", 
+            "Significant natural gas production", 
+            "Emerging exporter of natural gas"
+            ),
+        "Cuba": (
+            "Rich in nickel, cobalt",
+            "Major nickel producer", 
+            "Important exporter of nickel and cobalt"
+            ),
+        "Venezuela": (
+            "Large petroleum reserves",
+            "Major oil producer", 
+            "Key oil exporter"
+            ),
+        "Suriname": (
+            "Significant bauxite reserves",
+            "Notable bauxite production",
+            "Bauxite exporter"
+            ),
+        "Guinea": (
+            "World-leading bauxite reserves",
+            "Top bauxite producer", 
+            "Major bauxite exporter"
+            ),
+        "Senegal": (
+            "Significant phosphate reserves",
+            "Phosphate production", 
+            "Phosphate exporter"
+            ),
+        "Cameroon": (
+            "Emerging iron ore, bauxite production",
+            "Developing mining sector",
+            "Potential exporter of iron ore and bauxite"
+            ),
+        "Sierra Leone": (
+            "Rich in diamonds", 
+            "Significant diamond producer",
+            "Diamond exporter"
+            ),
+        "Ivory Coast": (
+            "Growing gold, manganese production",
+            "Emerging in gold and manganese", 
+            "Potential gold and manganese exporter"
+            ),
+        "Liberia": (
+            "Iron ore reserves",
+            "Iron ore production",
+            "Iron ore exporter"
+            ),
+        "Mozambique": (
+            "Significant coal, titanium reserves",
+            "Coal and titanium production", 
+            "Coal and titanium exporter"
+            ),
+        "Madagascar": (
+            "Large graphite, nickel reserves",
+            "Graphite and nickel production", 
+            "Graphite and nickel exporter"
+            ),
+        "Lesotho": (
+            "Significant diamond reserves",
+            "Diamond production",
+            "Diamond exporter"
+            ),
+        "Ethiopia": (
+            "Emerging in opal, gold, and tantalum",
+            "Opal, gold, and tantalum production",
+            "Opal, gold, and tantalum exporter"
+            ),
+        "Kyrgyzstan": (
+            "Gold, coal, and antimony reserves", 
+            "Gold, coal, and antimony production",
+            "Gold, coal, and antimony exporter"
+            ),
+        "Tajikistan": (
+            "Significant silver and gold reserves",
+            "Silver and gold production",
+            "Silver and gold exporter"
+            ),
+        "Myanmar": (
+            "Rich in jade, gems, and tin",
+            "Jade, gems, and tin production", 
+            "Jade, gems, and tin exporter"
+            ),
+        "Laos": (
+            "Emerging potash and gold production",
+            "Developing mining sector for potash and gold", 
+            "Potential potash and gold exporter"
+            ),
+        "Brunei": (
+            "Petroleum and natural gas reserves",
+            "Petroleum and natural gas production",
+            "Petroleum and natural gas exporter"
+            ),
+        "Turkmenistan": (
+            "Significant natural gas reserves",
+            "Natural gas production", 
+            "Natural gas exporter"
+            ),
+        "Uzbekistan": (
+            "Gold, uranium, and copper reserves", 
+            "Gold, uranium, and copper production",
+            "Gold, uranium, and copper exporter"
+            )
+    })
 
+# Tables that are only needed by a few loaders are built on first access 
+# and then cached as plain module attributes.
+_LAZY_BUILDERS = {
+    "DYSPNEA_DICT": _build_dyspnea_dict,
+    "DYSPNEA_LABELS_DESCR": _build_dyspnea_labels_descr,
+    "FORENSIC_BF_DICT": _build_forensic_bf_dict,
+    "FORENSIC_LABELS_DESCR": _build_forensic_labels_descr,
+    "HYDRO_PARAMS": _build_hydro_params,
+    "RELEVANT_HYDRO_PARAMS": _build_relevant_hydro_params,
+    "HYDRO_PARAM_UNITS": _build_hydro_param_units,
+    "MINERAL_PROD_BY_COUNTRY": _build_mineral_prod_by_country,
+}
+from .._lazy import attach 
+__getattr__, __dir__ = attach(__name__, globals(), _LAZY_BUILDERS)
+del attach 
@@ -25,8 +25,6 @@ from ..tools.coreutils import  random_sampling, assert_ratio, key_checker
 from ..tools.coreutils import  format_to_datetime, is_in_if, validate_feature
 from ..tools.coreutils import convert_to_structured_format, resample_data
 from ..tools.coreutils import split_train_test_by_id
-from ._globals import FORENSIC_BF_DICT, FORENSIC_LABELS_DESCR 
-from ._globals import DYSPNEA_DICT, DYSPNEA_LABELS_DESCR
 from .io import csv_data_loader, _to_dataframe, DMODULE 
 from .io import description_loader, DESCR, RemoteDataURL  
 
@@ -386,6 +384,7 @@ def load_dyspnea(
     if as_frame: 
         return to_numeric_dtypes(frame)
     
+    from ._globals import DYSPNEA_DICT, DYSPNEA_LABELS_DESCR
     fdescr = description_loader(descr_module=DESCR,descr_file="dyspnea.rst")
     
     return Boxspace(
@@ -398,7 +397,7 @@ def load_dyspnea(
         filename=data_file,
         data_module=DMODULE,
         labels_descr=DYSPNEA_LABELS_DESCR,
-        columns_descr=DYSPNEA_DICT
+        columns_descr=dict(DYSPNEA_DICT)
     )
 
 def load_hlogs(
@@ -1411,6 +1410,7 @@ def load_forensic( *,
     if as_frame: 
         return to_numeric_dtypes(frame )
     
+    from ._globals import FORENSIC_BF_DICT, FORENSIC_LABELS_DESCR
     fdescr = description_loader(
         descr_module=DESCR,descr_file=data_file.replace (".csv", ".rst"))
     
@@ -1424,7 +1424,7 @@ def load_forensic( *,
         filename=data_file,
         data_module=DMODULE,
         labels_descr=FORENSIC_LABELS_DESCR,
-        colums_descr= FORENSIC_BF_DICT
+        colums_descr= dict(FORENSIC_BF_DICT)
     )
 load_forensic.__doc__="""\
 Load and return the forensic dataset for criminal investigation studies.
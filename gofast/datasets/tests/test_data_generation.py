@@ -93,5 +93,110 @@ def test_dataset_generators_batch2(function, config):
             )
     print(f"Test passed with configuration: {config}")
 
-if __name__=="__main__": 
+@pytest.mark.parametrize("function", [
+    make_african_demo, make_agronomy_feedback, make_mining_ops, make_sounding,
+    make_medical_diagnosis, make_well_logging, make_ert, make_tem, make_erp, 
+    make_elogging, make_gadget_sales, make_retail_store])
+def test_generator_seed_is_local(function):
+    state = np.random.get_state()[1].copy()
+    df1 = function(as_frame=True, return_X_y=False, seed=np.random.SeedSequence(7))
+    df2 = function(as_frame=True, return_X_y=False, seed=np.random.SeedSequence(7))
+    pd.testing.assert_frame_equal(df1, df2)
+    # The global NumPy random state must not be reseeded.
+    np.testing.assert_array_equal(np.random.get_state()[1], state)
+
+def test_split_X_y_without_return_X_y():
+    X, Xt, y, yt = make_ert(samples=100, split_X_y=True, return_X_y=False, 
+                            seed=0)
+    assert X.shape == (70, 4) and Xt.shape == (30, 4)
+    assert len(y) == 70 and len(yt) == 30
+
+def test_boxspace_feature_names_follow_columns():
+    box = make_mining_ops(samples=10, return_X_y=False, seed=0)
+    assert box.feature_names == [
+        c for c in box.frame.columns if c not in box.target_names]
+
+def test_float_samples_are_coerced():
+    X, y = make_tem(samples=50.)
+    assert len(X) == len(y) == 50
+
+def test_seed_is_mixed_with_dataset_name():
+    from gofast.datasets._create import _check_seed
+    (rng_a, seed_a), (rng_b, seed_b) = _check_seed(0, 'a'), _check_seed(0, 'b')
+    assert seed_a == seed_b == 0
+    assert rng_a.random() != rng_b.random()
+    assert _check_seed(0, 'a')[0].random() == _check_seed(0, 'a')[0].random()
+
+def test_elogging_accepts_repeated_log_levels():
+    data = make_elogging(samples=200, log_levels=['INFO', 'INFO', 'ERROR'],
+                         as_frame=True, return_X_y=False, seed=0)
+    assert list(data['log_level'].cat.categories) == ['INFO', 'ERROR']
+    assert (data['log_level'] == 'INFO').mean() > 0.5
+    expected = 'This is a ' + data['log_level'].astype(str) + ' message.'
+    assert (data['message'].astype(str) == expected).all()
+
+def test_dates_keep_timezone_of_start_date():
+    logs = make_elogging(start_date='2021-01-01 00:00+02:00', 
+                         end_date='2021-01-02 00:00+02:00', samples=50, 
+                         as_frame=True, return_X_y=False, seed=0)
+    assert str(logs['timestamp'].dt.tz) == 'UTC+02:00'
+    assert logs['timestamp'].min() >= pd.Timestamp('2021-01-01 00:00+02:00')
+    sales = make_gadget_sales(start_date='2021-01-01 00:00+02:00', 
+                              end_date='2021-01-31 00:00+02:00', samples=50, 
+                              as_frame=True, return_X_y=False, seed=0)
+    assert str(sales['sale_date'].dt.tz) == 'UTC+02:00'
+    assert (sales['sale_date'].dt.hour == 0).all()
+
+def test_return_X_y_arrays_are_writable_under_copy_on_write():
+    with pd.option_context('mode.copy_on_write', True):
+        X, y = make_sounding(samples=10, return_X_y=True, seed=0)
+    assert X.flags.writeable and y.flags.writeable
+    y[0] = 0
+
+def test_return_X_y_with_every_column_as_target():
+    columns = ['depth_m', 'gamma_ray_api', 'resistivity_ohm_meter',
+               'density_g_cm3', 'neutron_porosity_percent']
+    X, y = make_well_logging(return_X_y=True, target_names=columns, seed=0)
+    assert X.shape == (400, 0) and y.shape == (400, 5)
+
+def test_medical_diagnosis_box_pickle_round_trip():
+    import copy, pickle
+    box = make_medical_diagnosis(samples=20, return_X_y=False, seed=0)
+    restored = pickle.loads(pickle.dumps(box))
+    assert restored.feature_units == box.feature_units
+    assert copy.deepcopy(box).feature_units == box.feature_units
+
+def test_manage_data_stacks_columns_like_frame():
+    from gofast.datasets._create import _manage_data
+    columns = {'a': np.arange(4, dtype=np.int8),
+               'b': pd.Categorical.from_codes([0, 1, 1, 0], ['x', 'y']),
+               'c': np.linspace(0, 1, 4, dtype=np.float32)}
+    X, y = _manage_data(dict(columns), return_X_y=True, target_names=['c'])
+    Xf, yf = _manage_data(pd.DataFrame(columns), return_X_y=True,
+                          target_names=['c'])
+    assert X.dtype == Xf.dtype and y.dtype == yf.dtype
+    np.testing.assert_array_equal(X, Xf)
+    np.testing.assert_array_equal(y, yf)
+
+def test_uniform_stays_below_high():
+    from gofast.datasets._create import _uniform
+    values = _uniform(np.random.default_rng(0), 36.5, 38, 5_000_000)
+    assert values.dtype == np.float32
+    assert values.min() >= 36.5 and values.max() < 38
+    bounds = np.array([[0, 1], [36.5, 38]], dtype=np.float32)
+    columns = _uniform(np.random.default_rng(0), bounds[:, :1], bounds[:, 1:],
+                       (2, 1_000_000))
+    assert (columns.max(axis=1) < bounds[:, 1]).all()
+
+def test_chunked_draws_do_not_depend_on_cpu_count(monkeypatch):
+    from gofast.datasets import _create
+    size = (2, _create._PARALLEL_MIN_SIZE)
+    monkeypatch.setattr(_create.os, "cpu_count", lambda: 1)
+    serial = _create._random(np.random.default_rng(0), size)
+    monkeypatch.setattr(_create.os, "cpu_count", lambda: 4)
+    threaded = _create._random(np.random.default_rng(0), size)
+    np.testing.assert_array_equal(serial, threaded)
+    assert serial.dtype == np.float32 and 0 <= serial.min() < serial.max() < 1
+
+if __name__=="__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+test_globals.py
+
+@author: LKouadio <etanoyau@gmail.com>
+"""
+import copy
+import pickle
+import pytest
+import numpy as np
+from gofast.datasets._globals import CategoricalMap, RegionTable, YES_NO
+from gofast.datasets._globals import MAYBE_NO_YES, WATER_QUAL_NEEDS
+from gofast.datasets._globals import DYSPNEA_LABELS_DESCR, FORENSIC_LABELS_DESCR
+from gofast.datasets._globals import ORE_TYPE, EXPLOSIVE_TYPE
+from gofast.datasets._globals import WATER_QUAN_NEEDS, WATER_QUAN_SHORT, WATER_QUAN_LONG
+from gofast.datasets._globals import COMMON_PESTICIDES, COMMON_PESTICIDES_SET
+from gofast.datasets._globals import EQUIPMENT_TYPE, EQUIPMENT_TYPE_CANON, EQUIPMENT_CODE
+
+def test_categorical_map_behaves_like_dict():
+    cmap = CategoricalMap({2: 'IV', 1: 'III', 0: 'II'})
+    assert cmap[2] == 'IV'
+    assert cmap == {0: 'II', 1: 'III', 2: 'IV'}
+    assert list(cmap) == [0, 1, 2]
+    assert len(cmap) == 3
+    assert cmap.to_dict() == {0: 'II', 1: 'III', 2: 'IV'}
+    assert cmap.inverse == {'II': 0, 'III': 1, 'IV': 2}
+    assert pickle.loads(pickle.dumps(cmap)) == cmap
+
+def test_categorical_map_narrow_dtype_and_packing():
+    cmap = CategoricalMap({0: 'No', 1: 'Yes'})
+    assert cmap.dtype == np.uint8
+    codes = np.array([1, 0, 1, 1, 0, 0, 1, 0, 1, 1], dtype=np.uint8)
+    packed = cmap.pack(codes)
+    assert packed.nbytes == 2
+    np.testing.assert_array_equal(cmap.unpack(packed, len(codes)), codes)
+    with pytest.raises(ValueError):
+        CategoricalMap({0: 'II', 1: 'III', 2: 'IV'}).pack([0, 2])
+
+def test_categorical_map_decode():
+    cmap = DYSPNEA_LABELS_DESCR['nyha_intensity']
+    decoded = cmap.decode(np.array([2, 0, 1, 2]))
+    assert list(decoded) == ['IV', 'II', 'III', 'IV']
+    with pytest.raises(IndexError):
+        cmap.decode([0, -1])
+
+def test_categorical_map_missing_codes():
+    cmap = CategoricalMap({0: 'No', 2: 'Yes'})
+    assert len(cmap) == 2
+    assert 1 not in cmap and -1 not in cmap and 'No' not in cmap
+    with pytest.raises(KeyError):
+        cmap[1]
+    assert cmap.get(3, 'missing') == 'missing'
+
+def test_categorical_map_key_normalization():
+    cmap = CategoricalMap({0: 'No', 1: 'Yes'})
+    assert cmap[1.0] == cmap.get(1.0) == cmap[np.int64(1)] == 'Yes'
+    assert 1.0 in cmap and 0.0 in cmap
+    for key in (True, np.True_, 1.5, 2, 2.0, -1, float('nan'), '1', None):
+        assert key not in cmap
+        assert cmap.get(key) is None
+        with pytest.raises(KeyError):
+            cmap[key]
+
+@pytest.mark.parametrize("descr", [DYSPNEA_LABELS_DESCR, FORENSIC_LABELS_DESCR])
+def test_labels_descr_are_categorical_maps(descr):
+    for labels in descr.values():
+        assert isinstance(labels, CategoricalMap)
+    assert descr['gender'][1] == 'Male'
+    assert descr.gender is descr['gender']
+    assert not hasattr(descr, '__dict__')
+    with pytest.raises(KeyError):
+        descr['to_dict']
+    with pytest.raises(AttributeError):
+        descr.gender = None
+
+@pytest.mark.parametrize("descr", [DYSPNEA_LABELS_DESCR, FORENSIC_LABELS_DESCR])
+def test_labels_descr_pickle_and_copy(descr):
+    restored = pickle.loads(pickle.dumps(descr))
+    assert type(restored).__name__ == type(descr).__name__
+    assert restored == descr and list(restored) == list(descr)
+    assert restored['gender'] is descr['gender']
+    assert copy.copy(descr) is descr
+    assert copy.deepcopy(descr) is descr
+
+def test_identical_label_tables_are_shared():
+    assert DYSPNEA_LABELS_DESCR['cough'] is YES_NO
+    assert DYSPNEA_LABELS_DESCR['fever'] is YES_NO
+    assert DYSPNEA_LABELS_DESCR['gender'] is FORENSIC_LABELS_DESCR['gender']
+
+def test_shared_label_arrays_are_read_only():
+    region_table = WATER_QUAL_NEEDS['Region']
+    for array in (YES_NO.labels, MAYBE_NO_YES.labels, ORE_TYPE.labels, 
+                  EXPLOSIVE_TYPE.labels, region_table.regions, 
+                  region_table.lang_codes, region_table.region_codes):
+        assert not array.flags.writeable
+    with pytest.raises(ValueError):
+        YES_NO.labels[1] = 'x'
+    assert YES_NO[1] == 'Yes'
+
+def test_prefix_indexed_types():
+    assert ORE_TYPE['Type1'] == 'Gold Ore'
+    assert EXPLOSIVE_TYPE['Explosive33'] == 'Electronic Detonators'
+    assert len(ORE_TYPE) == 33 and list(ORE_TYPE)[-1] == 'Type33'
+    for key in ('Type0', 'Type01', 'Type34', 'Explosive1', 1):
+        assert key not in ORE_TYPE
+    assert list(ORE_TYPE.labels[[0, 2]]) == ['Gold Ore', 'Copper Ore']
+
+def test_pesticides_are_separate_items():
+    assert 'Fungicide' in COMMON_PESTICIDES_SET
+    assert 'Glyphosate' in COMMON_PESTICIDES_SET
+    assert len(COMMON_PESTICIDES_SET) == len(COMMON_PESTICIDES)
+
+def test_region_table_keeps_language_order():
+    table = RegionTable({'Bron': ["Cote d'Ivoire", 'Ghana'],
+                         'Asante': ['Ghana', "Cote d'Ivoire"]})
+    assert len(table.regions) == 2
+    assert table['Asante'] == ('Ghana', "Cote d'Ivoire")
+    assert table['Bron'] == tuple(table.regions_for('Bron'))
+    with pytest.raises(KeyError):
+        table['Zulu']
+    assert list(table) == ['Bron', 'Asante']
+    with pytest.raises(KeyError):
+        table.regions_for('Zulu')
+
+def test_equipment_aliases_share_canonical_code():
+    assert set(EQUIPMENT_CODE) == set(EQUIPMENT_TYPE)
+    assert EQUIPMENT_CODE['Excavator'] == EQUIPMENT_CODE['Excavators']
+    assert EQUIPMENT_CODE['Haul Trucks'] != EQUIPMENT_CODE['Dump Trucks']
+    assert EQUIPMENT_TYPE_CANON[EQUIPMENT_CODE['Loader']] == 'Loaders'
+    assert len(set(EQUIPMENT_TYPE_CANON)) == len(EQUIPMENT_TYPE_CANON)
+
+def test_water_quan_needs_parallel_tuples():
+    assert WATER_QUAN_NEEDS['Agri Demand'] == 'Agricultural Water Demand'
+    assert tuple(WATER_QUAN_NEEDS) == WATER_QUAN_SHORT
+    assert list(WATER_QUAN_NEEDS.items()) == list(
+        zip(WATER_QUAN_SHORT, WATER_QUAN_LONG))
+    assert len(WATER_QUAN_NEEDS.items()) == len(WATER_QUAN_SHORT)
+    assert ('Forestry', 'Water for Forestry') in WATER_QUAN_NEEDS.items()
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -4,6 +4,8 @@ test_load.py
 
 @author: LKouadio <etanoyau@gmail.com>
 """
+import copy
+import pickle
 import pytest
 import scipy 
 from unittest.mock import patch
@@ -81,6 +83,16 @@ def test_base_load_dyspnea():
     assert isinstance(y, pd.Series)
     assert isinstance(yt, pd.Series)
 
+@pytest.mark.parametrize("loader", [load_dyspnea, load_forensic])
+def test_loaded_box_pickle_round_trip(loader):
+    box = loader()
+    restored = pickle.loads(pickle.dumps(box))
+    assert set(restored) == set(box)
+    assert restored.labels_descr == box.labels_descr
+    descr_key = 'columns_descr' if 'columns_descr' in box else 'colums_descr'
+    assert restored[descr_key] == box[descr_key]
+    assert copy.deepcopy(box)[descr_key] == box[descr_key]
+
 def test_load_forensic():
     """
     Run dataset tests on the forensic dataset with various configurations.
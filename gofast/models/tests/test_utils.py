@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+test_utils.py
+
+@author: LKouadio <etanoyau@gmail.com>
+"""
+import pytest
+import numpy as np
+from sklearn.metrics import get_scorer_names
+
+from gofast.models.utils import get_scorers, get_split_best_scores
+from gofast.models.utils import get_cv_mean_std_scores
+
+def test_get_scorers():
+    assert set(get_scorers()) == set(get_scorer_names())
+    assert get_scorers(scorer='accuracy', check_scorer=True)
+    assert not get_scorers(scorer='accuracy_', check_scorer=True)
+    with pytest.raises(ValueError):
+        get_scorers(scorer='accuracy_', check_scorer=True, error='raise')
+    with pytest.raises(ValueError):
+        get_scorers(check_scorer=True)
+
+def test_get_split_best_scores():
+    cvres = {'split0_test_score': [0.5, 0.9, 0.7],
+             'mean_test_score': np.array([0.4, 0.8, 0.6]),
+             'std_test_score': np.array([0.1, 0.2, 0.3]),
+             'params': [{'C': 1}, {'C': 10}, {'C': 100}]}
+    bests = get_split_best_scores(cvres, split=0)
+    assert bests['param'] == {'C': 10}
+    assert bests['accuracy_score'] == 0.8 and bests['std_score'] == 0.2
+    assert bests['CV0_score'] == 0.9
+    assert np.isclose(bests['CV0_mean_score'], 0.7)
+
+def test_get_cv_mean_std_scores_accepts_lists():
+    cvres = {'mean_test_score': [0.5, 0.7, np.nan], 
+             'std_test_score': [0.1, 0.3, 0.2]}
+    assert np.isnan(get_cv_mean_std_scores(cvres)[0])
+    mean, std = get_cv_mean_std_scores(cvres, ignore_convergence_problem=True)
+    assert np.isclose(mean, 0.6) and np.isclose(std, 0.2)
+    with pytest.raises(ValueError):
+        get_cv_mean_std_scores(cvres, score_type='train_score')
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -4,6 +4,7 @@
 
 from __future__ import annotations 
 import itertools 
+from functools import lru_cache
 import numpy as np 
 import pandas as pd
 import scipy
@@ -650,15 +651,18 @@ def get_cv_mean_std_scores(
     if mean_key not in cvres or std_key not in cvres:
         raise ValueError(f"Score type '{score_type}' not found in cvres.")
 
+    # Convert once so list-valued results are handled as well.
+    mean_scores = np.asarray(cvres[mean_key])
+    std_scores = np.asarray(cvres[std_key])
     if ignore_convergence_problem:
-        mean_aggregate = ( np.nanmean(cvres[mean_key]) if aggregation_method == 'mean' 
-                          else np.nanmedian(cvres[mean_key]))
-        std_aggregate = np.nanmean(cvres[std_key])
+        mean_aggregate = ( np.nanmean(mean_scores) if aggregation_method == 'mean' 
+                          else np.nanmedian(mean_scores))
+        std_aggregate = np.nanmean(std_scores)
     else:
-        mean_aggregate = ( cvres[mean_key].mean() if aggregation_method == 'mean' 
-                          else np.median(cvres[mean_key])
+        mean_aggregate = ( mean_scores.mean() if aggregation_method == 'mean' 
+                          else np.median(mean_scores)
                           )
-        std_aggregate = cvres[std_key].mean()
+        std_aggregate = std_scores.mean()
 
     return mean_aggregate, std_aggregate
 
@@ -686,10 +690,11 @@ def get_split_best_scores(cvres:Dict[str, ArrayLike],
     """
     #if split ==0: split =1 
     # get the split score 
-    split_score = cvres[f'split{split}_test_score'] 
-    # take the max score of the split 
-    max_sc = split_score.max() 
+    split_score = np.asarray(cvres[f'split{split}_test_score'])
+    # take the max score of the split from its position, saving a 
+    # second pass over the scores 
     ix_max = split_score.argmax()
+    max_sc = split_score[ix_max]
     mean_score= split_score.mean()
     # get parm and mean score 
     bests ={'param': cvres['params'][ix_max], 
@@ -731,16 +736,12 @@ def display_fine_tuned_results ( cvmodels: list[_F] ):
     cvmnodels: list
         list of fined-tuned models.
     """
-    bsi_bestestimators = [model.best_estimator_ for model in cvmodels ]
-    mnames = ( get_estimator_name(n) for n in bsi_bestestimators)
-    bsi_bestparams = [model.best_params_ for model in cvmodels]
-
-    for nam, param , estimator in zip(mnames, bsi_bestparams, 
-                                      bsi_bestestimators): 
-        print("MODEL NAME =", nam)
-        print('BEST PARAM =', param)
-        print('BEST ESTIMATOR =', estimator)
-        print()
+    # Build the whole report first and write it at once. 
+    print(''.join( 
+        f"MODEL NAME = {get_estimator_name(model.best_estimator_)}\n"
+        f"BEST PARAM = {model.best_params_}\n"
+        f"BEST ESTIMATOR = {model.best_estimator_}\n\n"
+        for model in cvmodels ), end='')
 
 def display_cv_tables(cvres:Dict[str, ArrayLike],  cvmodels:list[_F] ): 
     """ Display the cross-validation results from all models at each 
@@ -1077,6 +1078,19 @@ def comparative_analysis(cv_scores_dict):
         }
     return analysis_results
 
+@lru_cache(maxsize=1)
+def _scorer_names() -> Tuple[str]: 
+    """ Names of the scikit-learn scorers, fetched once per session. """
+    from sklearn import metrics
+    try:
+        return tuple(metrics.SCORERS.keys()) 
+    except: return tuple (metrics.get_scorer_names()) 
+
+@lru_cache(maxsize=1)
+def _scorer_set() -> frozenset: 
+    """ Scorer names as a set, for membership tests. """
+    return frozenset(_scorer_names())
+
 def get_scorers (*, scorer:str=None, check_scorer:bool=False, 
                  error:str='ignore')-> Tuple[str] | bool: 
     """ Fetch the list of available metrics from scikit-learn or verify 
@@ -1099,21 +1113,18 @@ def get_scorers (*, scorer:str=None, check_scorer:bool=False,
             ` scorer` is not ``None``, or the tuple of scikit-metrics. 
             :mod:`sklearn.metrics`
     """
-    from sklearn import metrics
-    try:
-        scorers = tuple(metrics.SCORERS.keys()) 
-    except: scorers = tuple (metrics.get_scorer_names()) 
+    scorers = _scorer_names()
     
     if check_scorer and scorer is None: 
         raise ValueError ("Can't check the scorer while the scorer is None."
                           " Provide the name of the scorer or get the list of"
                           " scorer by setting 'check_scorer' to 'False'")
     if scorer is not None and check_scorer: 
-        scorers = scorer in scorers 
+        scorers = scorer in _scorer_set() 
         if not scorers and error =='raise': 
             raise ValueError(
                 f"Wrong scorer={scorer!r}. Supports only scorers:"
-                f" {tuple(metrics.SCORERS.keys())}")
+                f" {_scorer_names()}")
             
     return scorers 
 
@@ -1574,6 +1585,7 @@ def dummy_evaluation(
     cv: int = 7,
     scoring: str = 'accuracy',
     display: bool = False,
+    n_jobs: int = -1,
     **kwargs: Dict[str, Any]
 ) -> Tuple[NDArray, float]:
     """
@@ -1593,6 +1605,9 @@ def dummy_evaluation(
         Scoring metric to use (default is 'accuracy').
     display : bool
         If True, print the model name, scores, and their mean (default is False).
+    n_jobs : int
+        Number of jobs to run the folds in parallel (-1 means using all 
+        processors, default is -1).
     **kwargs : dict
         Additional keyword arguments passed to `cross_val_score`.
 
@@ -1615,7 +1630,8 @@ def dummy_evaluation(
     Scores: [0.95, 0.92, 0.95, 0.98]
     Mean score: 0.95
     """
-    scores = cross_val_score(model, X, y, cv=cv, scoring=scoring, **kwargs)
+    scores = cross_val_score(model, X, y, cv=cv, scoring=scoring, 
+                             n_jobs=n_jobs, **kwargs)
     mean_score = np.mean(scores)
 
     if display:
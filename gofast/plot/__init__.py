@@ -1,71 +1,93 @@
 # -*- coding: utf-8 -*-
- 
-from .evaluate import ( 
-    EvalPlotter, MetricPlotter, 
-    plot_unified_pca, 
-    plot_learning_inspection, 
-    plot_learning_inspections, 
-    plot_silhouette,
-    plot_dendrogram, 
-    plot_dendroheat, 
-    plot_loc_projection, 
-    plot_model, 
-    plot_reg_scoring, 
-    plot_matshow, 
-    plot_model_scores,
-    plot2d,  
-    pobj as plot_obj
-    )
-from .explore import EasyPlotter, QuestPlotter
-from .ts import TimeSeriesPlotter 
-from .utils import ( 
-    plot_mlxtend_heatmap , 
-    plot_mlxtend_matrix, 
-    plot_cost_vs_epochs, 
-    plot_elbow, 
-    plot_clusters, 
-    plot_pca_components, 
-    plot_base_dendrogram, 
-    plot_learning_curves, 
-    plot_confusion_matrices, 
-    plot_yb_confusion_matrix, 
-    plot_sbs_feature_selection, 
-    plot_regularization_path, 
-    plot_rf_feature_importances, 
-    plot_base_silhouette, 
-    plot_voronoi, 
-    plot_roc_curves, 
-    plot_l_curve, 
-    plot_taylor_diagram, 
-    plot_cv, 
-    plot_confidence, 
-    plot_confidence_ellipse, 
-    plot_text, 
-    plot_cumulative_variance, 
-    plot_shap_summary, 
-    plot_custom_boxplot,
-    plot_abc_curve,
-    plot_permutation_importance,
-    create_radar_chart,
-    plot_r_squared, 
-    plot_cluster_comparison,
-    plot_sunburst, 
-    plot_sankey, 
-    plot_euler_diagram, 
-    create_upset_plot, 
-    plot_venn_diagram, 
-    create_matrix_representation, 
-    plot_feature_interactions, 
-    plot_regression_diagnostics, 
-    plot_residuals_vs_leverage, 
-    plot_residuals_vs_fitted, 
-    plot_variables, 
-    plot_correlation_with_target, 
-    plot_dependences, 
-    plot_pie_charts, 
-    plot_actual_vs_predicted, 
-    plot_r2
-    )
+"""
+Plotting utilities. The names below are resolved on first access, so that 
+``import gofast.plot`` does not load every plotting module up front.
+"""
+# Submodule defining each exported name.
+_SUBMODULES = {
+    '.evaluate': (
+        'EvalPlotter', 
+        'MetricPlotter', 
+        'plot_unified_pca', 
+        'plot_learning_inspection', 
+        'plot_learning_inspections', 
+        'plot_silhouette', 
+        'plot_dendrogram', 
+        'plot_dendroheat', 
+        'plot_loc_projection', 
+        'plot_model', 
+        'plot_reg_scoring', 
+        'plot_matshow', 
+        'plot_model_scores', 
+        'plot2d', 
+        ),
+    '.explore': (
+        'EasyPlotter', 
+        'QuestPlotter', 
+        'viewtemplate', 
+        ),
+    '.ts': (
+        'TimeSeriesPlotter', 
+        ),
+    '.utils': (
+        'plot_mlxtend_heatmap', 
+        'plot_mlxtend_matrix', 
+        'plot_cost_vs_epochs', 
+        'plot_elbow', 
+        'plot_clusters', 
+        'plot_pca_components', 
+        'plot_base_dendrogram', 
+        'plot_learning_curves', 
+        'plot_confusion_matrices', 
+        'plot_yb_confusion_matrix', 
+        'plot_sbs_feature_selection', 
+        'plot_regularization_path', 
+        'plot_rf_feature_importances', 
+        'plot_base_silhouette', 
+        'plot_voronoi', 
+        'plot_roc_curves', 
+        'plot_l_curve', 
+        'plot_taylor_diagram', 
+        'plot_cv', 
+        'plot_confidence', 
+        'plot_confidence_ellipse', 
+        'plot_text', 
+        'plot_cumulative_variance', 
+        'plot_shap_summary', 
+        'plot_custom_boxplot', 
+        'plot_abc_curve', 
+        'plot_permutation_importance', 
+        'create_radar_chart', 
+        'plot_r_squared', 
+        'plot_cluster_comparison', 
+        'plot_sunburst', 
+        'plot_sankey', 
+        'plot_euler_diagram', 
+        'create_upset_plot', 
+        'plot_venn_diagram', 
+        'create_matrix_representation', 
+        'plot_feature_interactions', 
+        'plot_regression_diagnostics', 
+        'plot_residuals_vs_leverage', 
+        'plot_residuals_vs_fitted', 
+        'plot_variables', 
+        'plot_correlation_with_target', 
+        'plot_dependences', 
+        'plot_pie_charts', 
+        'plot_actual_vs_predicted', 
+        'plot_r2', 
+        ),
+    }
+_LAZY = {name: (module, name) for module, names in _SUBMODULES.items() 
+         for name in names}
+_LAZY['plot_obj'] = ('.evaluate', 'pobj')
+# The submodules themselves stay reachable, e.g. ``gofast.plot.utils``.
+_LAZY.update({module[1:]: (module, None) for module in _SUBMODULES})
+
+from .._lazy import attach, from_submodules 
+__getattr__, __dir__ = attach(
+    __name__, globals(), from_submodules(__name__, _LAZY))
+del attach, from_submodules 
 
 __all__= [
     "MetricPlotter", 
@@ -1,49 +1,65 @@
 # -*- coding: utf-8 -*-
+"""
+Descriptive statistics, statistical tests and probability helpers. 
+`utils` and `proba` are imported the first time one of their functions is 
+looked up on the package.
+"""
+# Submodule defining each exported name.
+_SUBMODULES = {
+    '.utils': (
+        'mean', 
+        'median', 
+        'mode', 
+        'var', 
+        'std', 
+        'get_range', 
+        'quartiles', 
+        'quantile', 
+        'correlation', 
+        'corr', 
+        'iqr', 
+        'z_scores', 
+        'describe', 
+        'skew', 
+        'kurtosis', 
+        't_test_independent', 
+        'perform_linear_regression', 
+        'chi2_test', 
+        'anova_test', 
+        'perform_kmeans_clustering', 
+        'hmean', 
+        'wmedian', 
+        'bootstrap', 
+        'kaplan_meier_analysis', 
+        'gini_coeffs', 
+        'mds_similarity', 
+        'dca_analysis', 
+        'perform_spectral_clustering', 
+        'levene_test', 
+        'kolmogorov_smirnov_test', 
+        'cronbach_alpha', 
+        'friedman_test', 
+        'statistical_tests', 
+        ),
+    '.proba': (
+        'normal_pdf', 
+        'normal_cdf', 
+        'binomial_pmf', 
+        'poisson_logpmf', 
+        'uniform_sampling', 
+        'stochastic_volatility_model', 
+        'hierarchical_linear_model', 
+        ),
+    }
+_LAZY = {name: (module, name) for module, names in _SUBMODULES.items() 
+         for name in names}
+# The submodules themselves stay reachable, e.g. ``gofast.stats.utils``.
+_LAZY.update({module[1:]: (module, None) for module in _SUBMODULES})
 
-from .utils import ( 
-    mean,
-    median,
-    mode,
-    var,
-    std,
-    get_range,
-    quartiles,
-    correlation,
-    corr, 
-    iqr,
-    z_scores,
-    describe,
-    skew,
-    kurtosis,
-    t_test_independent,
-    perform_linear_regression,
-    chi2_test,
-    anova_test,
-    perform_kmeans_clustering,
-    hmean, 
-    wmedian, 
-    bootstrap, 
-    kaplan_meier_analysis, 
-    gini_coeffs, 
-    mds_similarity, 
-    dca_analysis, 
-    perform_spectral_clustering, 
-    levene_test, 
-    kolmogorov_smirnov_test, 
-    cronbach_alpha, 
-    friedman_test, 
-    statistical_tests, 
-    )
-
-from .proba import (  
-    normal_pdf,
-    normal_cdf, 
-    binomial_pmf, 
-    poisson_logpmf, 
-    uniform_sampling, 
-    stochastic_volatility_model, 
-    hierarchical_linear_model, 
-    )
+from .._lazy import attach, from_submodules 
+__getattr__, __dir__ = attach(
+    __name__, globals(), from_submodules(__name__, _LAZY))
+del attach, from_submodules 
 
 __all__=[ 
     "mean", 
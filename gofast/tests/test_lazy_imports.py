@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+test_lazy_imports.py
+
+@author: LKouadio <etanoyau@gmail.com>
+"""
+import subprocess
+import sys
+
+import pytest
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True,
+                          text=True)
+
+def test_plot_submodules_load_on_first_access():
+    result = _run(
+        "import sys, gofast.plot as p\n"
+        "assert 'gofast.plot.evaluate' not in sys.modules\n"
+        "assert 'gofast.plot.utils' not in sys.modules\n"
+        "assert callable(p.plot_r2)\n"
+        "assert 'gofast.plot.utils' in sys.modules\n"
+        "assert 'plot_r2' in vars(p)\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_plot_all_names_are_resolvable():
+    import gofast.plot
+    submodules = {'evaluate', 'explore', 'ts', 'utils'}
+    assert set(gofast.plot._LAZY) == set(gofast.plot.__all__) | submodules
+    assert not submodules & set(gofast.plot.__all__)
+
+def test_stats_submodules_load_on_first_access():
+    result = _run(
+        "import sys, gofast.stats as st\n"
+        "assert 'gofast.stats.utils' not in sys.modules\n"
+        "assert st.mean([1, 2, 3]) == 2\n"
+        "assert 'mean' in vars(st)\n"
+        "assert set(st._LAZY) == set(st.__all__) | {'utils', 'proba'}\n"
+        "assert 'gofast.stats.proba' not in sys.modules\n"
+        "assert st.proba is sys.modules['gofast.stats.proba']\n"
+        "assert 'proba' in dir(st)\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_plot_submodules_are_attributes():
+    result = _run(
+        "import sys, gofast.plot as p\n"
+        "assert p.utils is sys.modules['gofast.plot.utils']\n"
+        "assert p.evaluate.plot_silhouette is p.plot_silhouette\n"
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_plot_unknown_name_raises_attribute_error():
+    import gofast.plot
+    with pytest.raises(AttributeError):
+        gofast.plot.not_a_plot
+
+if __name__ == "__main__":
+    pytest.main([__file__])